@@ -0,0 +1,119 @@
+using System;
+using UnityEditor;
+using UnityEditor.Build.Reporting;
+using UnityEngine;
+
+namespace Relic.CoreRTS.Editor
+{
+    /// <summary>
+    /// Batchmode build entry point used by tools/build.py.
+    /// </summary>
+    /// <remarks>
+    /// All build settings arrive as command-line arguments, so this script never changes
+    /// between builds and Unity does not recompile the editor assembly for each build:
+    /// <code>
+    /// -executeMethod Relic.CoreRTS.Editor.RelicBuildScript.Build
+    ///     -relicScene Assets/Scenes/AR_Battlefield.unity
+    ///     -relicTarget Android
+    ///     -relicOutput Builds/Relic_quest3_debug.apk
+    ///     -relicOptions Development,AllowDebugging
+    ///     -relicDefines QUEST_3;XR_ENABLED;DEVELOPMENT
+    /// </code>
+    /// </remarks>
+    public static class RelicBuildScript
+    {
+        /// <summary>
+        /// Builds the player described by the -relic* arguments and exits the editor
+        /// with 0 on success or 1 on failure.
+        /// </summary>
+        public static void Build()
+        {
+            string[] args = Environment.GetCommandLineArgs();
+            string scene = GetArgument(args, "-relicScene");
+            string targetName = GetArgument(args, "-relicTarget");
+            string outputPath = GetArgument(args, "-relicOutput");
+
+            if (string.IsNullOrEmpty(scene) || string.IsNullOrEmpty(targetName) || string.IsNullOrEmpty(outputPath))
+            {
+                Console.WriteLine("[RelicBuildScript] Missing -relicScene, -relicTarget or -relicOutput argument");
+                EditorApplication.Exit(1);
+                return;
+            }
+
+            if (!Enum.TryParse(targetName, out BuildTarget target))
+            {
+                Console.WriteLine($"[RelicBuildScript] Unknown build target: {targetName}");
+                EditorApplication.Exit(1);
+                return;
+            }
+
+            BuildPlayerOptions buildOptions = new BuildPlayerOptions
+            {
+                scenes = new[] { scene },
+                locationPathName = outputPath,
+                target = target,
+                options = ParseOptions(GetArgument(args, "-relicOptions"))
+            };
+
+            // Set scripting defines
+            PlayerSettings.SetScriptingDefineSymbolsForGroup(
+                BuildPipeline.GetBuildTargetGroup(target),
+                GetArgument(args, "-relicDefines") ?? string.Empty
+            );
+
+            BuildReport report = BuildPipeline.BuildPlayer(buildOptions);
+            BuildSummary summary = report.summary;
+
+            if (summary.result == BuildResult.Succeeded)
+            {
+                Console.WriteLine("Build succeeded: " + summary.totalSize + " bytes");
+                EditorApplication.Exit(0);
+            }
+            else
+            {
+                Console.WriteLine("Build failed");
+                EditorApplication.Exit(1);
+            }
+        }
+
+        /// <summary>
+        /// Returns the value following the given flag, or null if the flag is absent.
+        /// </summary>
+        private static string GetArgument(string[] args, string name)
+        {
+            for (int i = 0; i < args.Length - 1; i++)
+            {
+                if (args[i] == name)
+                {
+                    return args[i + 1];
+                }
+            }
+            return null;
+        }
+
+        /// <summary>
+        /// Parses a comma-separated list of <see cref="BuildOptions"/> names.
+        /// </summary>
+        private static BuildOptions ParseOptions(string value)
+        {
+            BuildOptions options = BuildOptions.None;
+            if (string.IsNullOrEmpty(value))
+            {
+                return options;
+            }
+
+            foreach (string name in value.Split(','))
+            {
+                if (Enum.TryParse(name.Trim(), out BuildOptions option))
+                {
+                    options |= option;
+                }
+                else
+                {
+                    Debug.LogWarning($"[RelicBuildScript] Ignoring unknown build option: {name}");
+                }
+            }
+            return options;
+        }
+    }
+}
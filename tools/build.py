@@ -16,6 +16,7 @@ Usage:
     python build.py quest3                    # Build for Quest 3
     python build.py debug                     # Build for debug/editor
     python build.py quest3 --profile release  # Release build
+    python build.py quest3 --profiles release,profile  # Parallel builds
     python build.py check                     # Pre-build validation only
 
 Environment Variables:
@@ -28,15 +29,20 @@ Example:
 """
 
 import argparse
+import functools
+import json
 import os
 import platform
-import shutil
-import subprocess
+import signal
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Optional
 
+# Host platform, resolved once at import
+_SYSTEM = platform.system()
+_HOME = Path.home()
+
 # Build profiles
 PROFILES = {
     "debug": {
@@ -69,8 +75,8 @@ TARGETS = {
         "defines": ["QUEST_3", "XR_ENABLED"],
     },
     "debug": {
-        "platform": "StandaloneLinux64" if platform.system() == "Linux" else "StandaloneWindows64",
-        "extension": ".x86_64" if platform.system() == "Linux" else ".exe",
+        "platform": "StandaloneLinux64" if _SYSTEM == "Linux" else "StandaloneWindows64",
+        "extension": ".x86_64" if _SYSTEM == "Linux" else ".exe",
         "scene": "Assets/Scenes/Flat_Debug.unity",
         "defines": ["DEBUG_MODE"],
     },
@@ -82,9 +88,64 @@ TARGETS = {
     },
 }
 
+# Checked-in editor script that performs batchmode builds (see get_build_args)
+BUILD_METHOD = "Relic.CoreRTS.Editor.RelicBuildScript.Build"
+
+# Cache of the last auto-detected Unity executable
+UNITY_CACHE_FILE = _HOME / ".cache/relic/unity_path.json"
+
+
+def _load_unity_cache() -> Optional[dict]:
+    """Load the cached Unity detection result, if any."""
+    try:
+        return json.loads(UNITY_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _hub_mtimes(possible_paths: list[Path]) -> dict[str, Optional[float]]:
+    """Return the mtime of each candidate Hub directory (None when it is absent)."""
+    mtimes = {}
+    for path in possible_paths:
+        try:
+            mtimes[str(path)] = path.stat().st_mtime
+        except OSError:
+            mtimes[str(path)] = None
+    return mtimes
+
+
+def _save_unity_cache(system: str, possible_paths: list[Path], unity_exe: Path) -> None:
+    """Persist a Unity detection result keyed by system and every Hub directory mtime."""
+    entry = {
+        "system": system,
+        "hub_mtimes": _hub_mtimes(possible_paths),
+        "unity_exe": str(unity_exe),
+    }
+    try:
+        UNITY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        UNITY_CACHE_FILE.write_text(json.dumps(entry))
+    except OSError:
+        pass  # Caching is best-effort
 
+
+def _cached_unity_executable(system: str, possible_paths: list[Path]) -> Optional[Path]:
+    """Return the cached Unity path if no Hub directory has changed since caching."""
+    entry = _load_unity_cache()
+    if not isinstance(entry, dict) or entry.get("system") != system:
+        return None
+
+    # A new editor install changes its Hub directory's mtime; every candidate is
+    # compared so an install under a higher-priority path is picked up too
+    if entry.get("hub_mtimes") != _hub_mtimes(possible_paths):
+        return None
+
+    unity_exe = Path(entry.get("unity_exe", ""))
+    return unity_exe if unity_exe.exists() else None
+
+
+@functools.lru_cache(maxsize=1)
 def find_unity_executable() -> Optional[Path]:
-    """Auto-detect Unity executable path."""
+    """Auto-detect Unity executable path (probed once per process)."""
     # Check environment variable first
     if "UNITY_PATH" in os.environ:
         path = Path(os.environ["UNITY_PATH"])
@@ -92,47 +153,61 @@ def find_unity_executable() -> Optional[Path]:
             return path
 
     # Platform-specific default locations
-    system = platform.system()
+    system = _SYSTEM
 
     if system == "Linux":
         possible_paths = [
-            Path.home() / "Unity/Hub/Editor",
+            _HOME / "Unity/Hub/Editor",
             Path("/opt/unity"),
         ]
     elif system == "Darwin":  # macOS
         possible_paths = [
             Path("/Applications/Unity/Hub/Editor"),
-            Path.home() / "Applications/Unity/Hub/Editor",
+            _HOME / "Applications/Unity/Hub/Editor",
         ]
     elif system == "Windows":
         possible_paths = [
             Path("C:/Program Files/Unity/Hub/Editor"),
-            Path.home() / "Unity/Hub/Editor",
+            _HOME / "Unity/Hub/Editor",
         ]
     else:
         return None
 
+    cached = _cached_unity_executable(system, possible_paths)
+    if cached:
+        return cached
+
     # Find Unity 6.x installation
     for base_path in possible_paths:
-        if not base_path.exists():
+        try:
+            with os.scandir(base_path) as entries:
+                candidates = sorted(
+                    (entry.name for entry in entries
+                     if entry.name.startswith("6000") and entry.is_dir()),  # Unity 6
+                    reverse=True,
+                )
+        except OSError:
             continue
-        for version_dir in sorted(base_path.iterdir(), reverse=True):
-            if version_dir.name.startswith("6000"):  # Unity 6
-                if system == "Darwin":
-                    unity_exe = version_dir / "Unity.app/Contents/MacOS/Unity"
-                elif system == "Windows":
-                    unity_exe = version_dir / "Editor/Unity.exe"
-                else:
-                    unity_exe = version_dir / "Editor/Unity"
-
-                if unity_exe.exists():
-                    return unity_exe
+
+        for name in candidates:
+            version_dir = base_path / name
+            if system == "Darwin":
+                unity_exe = version_dir / "Unity.app/Contents/MacOS/Unity"
+            elif system == "Windows":
+                unity_exe = version_dir / "Editor/Unity.exe"
+            else:
+                unity_exe = version_dir / "Editor/Unity"
+
+            if unity_exe.exists():
+                _save_unity_cache(system, possible_paths, unity_exe)
+                return unity_exe
 
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """Get the Relic project root directory."""
+    """Get the Relic project root directory (located once per process)."""
     # Assume we're in the tools directory
     tools_dir = Path(__file__).parent
     project_root = tools_dir.parent
@@ -159,82 +234,79 @@ def check_prerequisites(unity_path: Optional[Path], project_root: Path) -> list[
     elif not unity_path.exists():
         issues.append(f"Unity executable not found at: {unity_path}")
 
-    # Check project structure
-    if not (project_root / "Assets").exists():
-        issues.append("Assets/ directory not found. Unity project may not be initialized.")
-
-    if not (project_root / "ProjectSettings").exists():
-        issues.append("ProjectSettings/ directory not found. Unity project may not be initialized.")
-
-    # Check for required scenes
+    # Project structure and required scenes, paired with the issue reported if missing
+    checks = [
+        (project_root / "Assets", "Assets/ directory not found. Unity project may not be initialized."),
+        (
+            project_root / "ProjectSettings",
+            "ProjectSettings/ directory not found. Unity project may not be initialized.",
+        ),
+    ]
     for target_name, target_config in TARGETS.items():
-        scene_path = project_root / target_config["scene"]
-        if not scene_path.exists():
-            issues.append(f"Scene not found for {target_name}: {target_config['scene']}")
+        checks.append((
+            project_root / target_config["scene"],
+            f"Scene not found for {target_name}: {target_config['scene']}",
+        ))
+
+    # Read each parent directory once instead of stat-ing every path
+    present_names: dict[Path, set[str]] = {}
+    for path, issue in checks:
+        parent = path.parent
+        if parent not in present_names:
+            try:
+                with os.scandir(parent) as entries:
+                    present_names[parent] = {entry.name for entry in entries}
+            except OSError:
+                present_names[parent] = set()
+        if path.name not in present_names[parent]:
+            issues.append(issue)
 
     return issues
 
 
-def generate_build_script(
-    project_root: Path,
-    target: str,
-    profile: str,
-    output_path: Path,
-) -> str:
-    """Generate C# build script for Unity's batchmode."""
+def get_build_args(target: str, profile: str, output_path: Path) -> list[str]:
+    """Get the -relic* arguments read by RelicBuildScript.Build() in batchmode."""
     target_config = TARGETS[target]
     profile_config = PROFILES[profile]
 
+    options = []
+    if profile_config["development"]:
+        options.append("Development")
+    if profile_config.get("allow_debugging"):
+        options.append("AllowDebugging")
+    if profile_config.get("profiler"):
+        options.append("EnableDeepProfilingSupport")
+
     defines = target_config["defines"] + (["DEVELOPMENT"] if profile_config["development"] else [])
-    defines_str = ";".join(defines)
-
-    script = f'''
-using UnityEditor;
-using UnityEditor.Build.Reporting;
-using System;
-
-public class RelicBuildScript
-{{
-    public static void Build()
-    {{
-        string[] scenes = new string[] {{ "{target_config["scene"]}" }};
-        string outputPath = "{output_path.as_posix()}";
-
-        BuildPlayerOptions buildOptions = new BuildPlayerOptions();
-        buildOptions.scenes = scenes;
-        buildOptions.locationPathName = outputPath;
-        buildOptions.target = BuildTarget.{target_config["platform"]};
-
-        BuildOptions options = BuildOptions.None;
-        {"options |= BuildOptions.Development;" if profile_config["development"] else ""}
-        {"options |= BuildOptions.AllowDebugging;" if profile_config.get("allow_debugging") else ""}
-        {"options |= BuildOptions.EnableDeepProfilingSupport;" if profile_config.get("profiler") else ""}
-
-        buildOptions.options = options;
-
-        // Set scripting defines
-        PlayerSettings.SetScriptingDefineSymbolsForGroup(
-            BuildTargetGroup.{target_config["platform"].replace("Standalone", "Standalone")},
-            "{defines_str}"
-        );
-
-        BuildReport report = BuildPipeline.BuildPlayer(buildOptions);
-        BuildSummary summary = report.summary;
-
-        if (summary.result == BuildResult.Succeeded)
-        {{
-            Console.WriteLine("Build succeeded: " + summary.totalSize + " bytes");
-            EditorApplication.Exit(0);
-        }}
-        else
-        {{
-            Console.WriteLine("Build failed");
-            EditorApplication.Exit(1);
-        }}
-    }}
-}}
-'''
-    return script
+
+    return [
+        "-relicScene", target_config["scene"],
+        "-relicTarget", target_config["platform"],
+        "-relicOutput", output_path.as_posix(),
+        "-relicOptions", ",".join(options),
+        "-relicDefines", ";".join(defines),
+    ]
+
+
+def get_staging_path(output_dir: Path, target: str, profile: str) -> Path:
+    """Get the stable path Unity builds into for a target/profile pair."""
+    return output_dir / f"Relic_{target}_{profile}{TARGETS[target]['extension']}"
+
+
+def clean_staging(output_dir: Path, target: str, profile: str) -> None:
+    """Remove the staged build and the sidecar folders Unity keeps for incremental builds."""
+    import shutil
+
+    stage_path = get_staging_path(output_dir, target, profile)
+    stem = stage_path.with_suffix("").name
+    for sidecar in (
+        f"{stem}_Data",
+        f"{stem}_BackUpThisFolder_ButDontShipItWithYourGame",
+        f"{stem}_BurstDebugInformation_DoNotShip",
+    ):
+        shutil.rmtree(output_dir / sidecar, ignore_errors=True)
+    if stage_path.is_file():
+        stage_path.unlink()
 
 
 def run_unity_build(
@@ -243,27 +315,41 @@ def run_unity_build(
     target: str,
     profile: str,
     output_dir: Path,
+    clean: bool = False,
+    log_name: str = "build.log",
 ) -> int:
     """Run Unity build in batchmode."""
+    # Imported here so `check` and `--help` don't pay for them
+    import shutil
+    import subprocess
+    from datetime import datetime
+
     target_config = TARGETS[target]
 
-    # Generate output path
+    # Unity resolves relative paths against -projectPath, not our cwd
+    output_dir = output_dir.resolve()
+
+    # Unity builds into a stable staging path so IL2CPP/Burst can build incrementally;
+    # each successful build is then archived under a timestamped name
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     build_name = f"Relic_{target}_{profile}_{timestamp}{target_config['extension']}"
     output_path = output_dir / build_name
+    stage_path = get_staging_path(output_dir, target, profile)
+
+    if clean:
+        clean_staging(output_dir, target, profile)
 
     # Create build directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate build script
-    build_script = generate_build_script(project_root, target, profile, output_path)
-    script_path = project_root / "Assets/Editor/RelicBuildScript.cs"
-    script_path.parent.mkdir(parents=True, exist_ok=True)
-    script_path.write_text(build_script)
-
     print(f"Building Relic for {target} ({profile} profile)...")
     print(f"Output: {output_path}")
 
+    # Interactive runs let Unity write build.log itself; without a tty (CI) Unity logs
+    # to stdout and the OS redirects it into build.log, avoiding Unity's own log flushing
+    log_path = output_dir / log_name
+    stream_log = not sys.stdout.isatty()
+
     # Build Unity command
     cmd = [
         str(unity_path),
@@ -271,25 +357,47 @@ def run_unity_build(
         "-nographics",
         "-quit",
         "-projectPath", str(project_root),
-        "-executeMethod", "RelicBuildScript.Build",
-        "-logFile", str(output_dir / "build.log"),
+        "-executeMethod", BUILD_METHOD,
+        "-logFile", "-" if stream_log else str(log_path),
+        *get_build_args(target, profile, stage_path),
     ]
 
     print(f"Running: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)  # 30 min timeout
+        # Never buffer Unity's output in memory
+        log_output = open(log_path, "wb") if stream_log else subprocess.DEVNULL
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=log_output,
+                stderr=subprocess.STDOUT,
+                timeout=1800,  # 30 min timeout
+            )
+        finally:
+            if stream_log:
+                log_output.close()
         print(f"\nUnity exit code: {result.returncode}")
 
-        if result.returncode == 0:
+        if result.returncode == 0 and not stage_path.is_file():
+            print(f"\n✗ Build failed: Unity exited cleanly but did not produce {stage_path}")
+            print(f"See log: {log_path}")
+            return 1
+        elif result.returncode == 0:
+            shutil.copy2(stage_path, output_path)
+            # Standalone players load their data from a folder named after the
+            # executable; the engine libraries beside it are shared by name
+            data_dir = stage_path.with_name(f"{stage_path.stem}_Data")
+            if data_dir.is_dir():
+                archived_data = output_path.with_name(f"{output_path.stem}_Data")
+                shutil.copytree(data_dir, archived_data, symlinks=True)
             print(f"\n✓ Build successful: {output_path}")
-            if output_path.exists():
-                size_mb = output_path.stat().st_size / (1024 * 1024)
-                print(f"  Size: {size_mb:.2f} MB")
+            size_mb = output_path.stat().st_size / (1024 * 1024)
+            print(f"  Size: {size_mb:.2f} MB")
             return 0
         else:
             print("\n✗ Build failed")
-            print(f"See log: {output_dir / 'build.log'}")
+            print(f"See log: {log_path}")
             return 1
 
     except subprocess.TimeoutExpired:
@@ -298,10 +406,113 @@ def run_unity_build(
     except Exception as error:
         print(f"\n✗ Build error: {error}")
         return 1
-    finally:
-        # Cleanup build script
-        if script_path.exists():
-            script_path.unlink()
+
+
+def prepare_profile_workdir(project_root: Path, profile: str) -> Path:
+    """
+    Create (or reuse) a per-profile copy of the project for parallel builds.
+    Unity refuses to open one project in two editors, so each profile gets its own
+    directory with symlinked sources and a private ProjectSettings and Library.
+    """
+    import shutil
+
+    workdir = project_root.parent / f"Relic_{profile}_workdir"
+    workdir.mkdir(exist_ok=True)
+
+    for name in ("Assets", "Packages"):
+        link = workdir / name
+        if not link.exists() and not link.is_symlink():
+            link.symlink_to(project_root / name, target_is_directory=True)
+
+    # Each build writes its scripting defines into ProjectSettings, so every editor
+    # needs its own copy, refreshed from the project before each build
+    settings = workdir / "ProjectSettings"
+    if settings.is_symlink():
+        settings.unlink()  # Workdirs created before settings were copied
+    shutil.copytree(project_root / "ProjectSettings", settings, symlinks=True, dirs_exist_ok=True)
+
+    # Seed the import cache on first run so the workdir doesn't reimport everything
+    library = workdir / "Library"
+    if not library.exists() and (project_root / "Library").is_dir():
+        shutil.copytree(project_root / "Library", library, symlinks=True)
+
+    return workdir
+
+
+def run_profile_builds(
+    unity_path: Path,
+    project_root: Path,
+    target: str,
+    profiles: list[str],
+    output_dir: Path,
+    clean: bool = False,
+) -> int:
+    """Build several profiles of one target concurrently, one Unity process each."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    workdirs = {profile: prepare_profile_workdir(project_root, profile) for profile in profiles}
+
+    with ProcessPoolExecutor(max_workers=len(profiles)) as executor:
+        futures = {
+            profile: executor.submit(
+                run_unity_build, unity_path, workdirs[profile], target, profile, output_dir,
+                clean=clean, log_name=f"build_{profile}.log",
+            )
+            for profile in profiles
+        }
+        results = {profile: future.result() for profile, future in futures.items()}
+
+    print("\n=== Profile Builds ===")
+    for profile, result in results.items():
+        print(f"  {'✓' if result == 0 else '✗'} {profile}")
+
+    return 1 if any(results.values()) else 0
+
+
+@functools.lru_cache(maxsize=1)
+def _find_adb() -> Optional[str]:
+    """Resolve the ADB executable on PATH (once per process)."""
+    import shutil
+
+    return shutil.which("adb")
+
+
+def _spawn_wait(argv: list[str], quiet: bool = False, timeout: Optional[float] = None) -> Optional[int]:
+    """
+    Run a helper command and return its exit code, or None if it timed out.
+    Uses posix_spawn where available to avoid forking the Python process.
+    """
+    if not hasattr(os, "posix_spawn"):
+        import subprocess
+
+        output = subprocess.DEVNULL if quiet else None
+        try:
+            return subprocess.run(argv, stdout=output, stderr=output, timeout=timeout).returncode
+        except subprocess.TimeoutExpired:
+            return None
+
+    file_actions = []
+    if quiet:
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ]
+    pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=file_actions)
+
+    if timeout is None:
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status)
+
+    deadline = time.monotonic() + timeout
+    while True:
+        waited_pid, status = os.waitpid(pid, os.WNOHANG)
+        if waited_pid:
+            return os.waitstatus_to_exitcode(status)
+        if time.monotonic() >= deadline:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            return None
+        time.sleep(0.01)
 
 
 def install_apk(apk_path: Path) -> int:
@@ -309,32 +520,38 @@ def install_apk(apk_path: Path) -> int:
     print(f"\nInstalling APK: {apk_path}")
 
     # Check ADB
-    adb_path = shutil.which("adb")
+    adb_path = _find_adb()
     if not adb_path:
         print("Error: ADB not found in PATH")
         return 1
 
-    # Check device
-    result = subprocess.run([adb_path, "devices"], capture_output=True, text=True)
-    if "device" not in result.stdout.split("\n")[1:]:
+    # Check device (get-state exits non-zero unless exactly one device is ready)
+    if _spawn_wait([adb_path, "get-state"], quiet=True, timeout=5) != 0:
         print("Error: No ADB device connected")
         return 1
 
-    # Install
-    result = subprocess.run(
-        [adb_path, "install", "-r", str(apk_path)],
-        capture_output=True,
-        text=True
-    )
+    # Install (progress and errors stream straight to the terminal)
+    returncode = _spawn_wait([adb_path, "install", "-r", str(apk_path)])
 
-    if result.returncode == 0:
+    if returncode == 0:
         print("✓ APK installed successfully")
         return 0
     else:
-        print(f"✗ Install failed: {result.stderr}")
+        print(f"✗ Install failed (adb exit code {returncode})")
         return 1
 
 
+def parse_profiles(value: str) -> list[str]:
+    """Parse a comma-separated list of build profiles for --profiles."""
+    profiles = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in profiles if name not in PROFILES]
+    if unknown or not profiles:
+        raise argparse.ArgumentTypeError(
+            f"invalid profiles: {value!r} (choose from {', '.join(PROFILES)})"
+        )
+    return list(dict.fromkeys(profiles))
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -350,23 +567,47 @@ def main() -> int:
     quest3_parser.add_argument("--profile", choices=PROFILES.keys(), default="debug")
     quest3_parser.add_argument("--install", action="store_true", help="Install to connected device")
     quest3_parser.add_argument("--output", type=Path, help="Output directory")
+    quest3_parser.add_argument(
+        "--clean", action="store_true", help="Discard incremental build state first"
+    )
+    quest3_parser.add_argument(
+        "--profiles", type=parse_profiles,
+        help="Build several profiles in parallel (e.g. release,profile)"
+    )
 
     # Debug build
     debug_parser = subparsers.add_parser("debug", help="Build for debug/standalone")
     debug_parser.add_argument("--profile", choices=PROFILES.keys(), default="debug")
     debug_parser.add_argument("--output", type=Path, help="Output directory")
+    debug_parser.add_argument(
+        "--clean", action="store_true", help="Discard incremental build state first"
+    )
+    debug_parser.add_argument(
+        "--profiles", type=parse_profiles,
+        help="Build several profiles in parallel (e.g. release,profile)"
+    )
 
     # Android build
     android_parser = subparsers.add_parser("android", help="Build generic Android APK")
     android_parser.add_argument("--profile", choices=PROFILES.keys(), default="debug")
     android_parser.add_argument("--install", action="store_true")
     android_parser.add_argument("--output", type=Path, help="Output directory")
+    android_parser.add_argument(
+        "--clean", action="store_true", help="Discard incremental build state first"
+    )
+    android_parser.add_argument(
+        "--profiles", type=parse_profiles,
+        help="Build several profiles in parallel (e.g. release,profile)"
+    )
 
     # Check command
     subparsers.add_parser("check", help="Check prerequisites only")
 
     args = parser.parse_args()
 
+    if getattr(args, "profiles", None) and getattr(args, "install", False):
+        parser.error("--install needs a single --profile and cannot be combined with --profiles")
+
     if not args.target:
         parser.print_help()
         return 0
@@ -405,7 +646,14 @@ def main() -> int:
 
     # Run build
     output_dir = args.output or (project_root / "Builds")
-    result = run_unity_build(unity_path, project_root, args.target, args.profile, output_dir)
+    if args.profiles:
+        result = run_profile_builds(
+            unity_path, project_root, args.target, args.profiles, output_dir, clean=args.clean
+        )
+    else:
+        result = run_unity_build(
+            unity_path, project_root, args.target, args.profile, output_dir, clean=args.clean
+        )
 
     # Install if requested
     if result == 0 and hasattr(args, "install") and args.install:
@@ -20,22 +20,25 @@ Usage:
 Example:
     python config_validator.py validate configs/eras/ancient.yaml
     python config_validator.py validate-all configs/
+    python config_validator.py validate-all configs/ --jobs 4
+    python config_validator.py validate-all configs/ --no-warnings
     python config_validator.py schema UnitArchetype
 """
 
-import argparse
-import json
+import copy
+import functools
+import os
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# PyYAML loader class, resolved on first YAML load (see _get_yaml_loader)
+_YAML_LOADER = None
+
+# JSON parse function, resolved on first JSON load (see _get_json_loads)
+_JSON_LOADS = None
 
 
 class ConfigType(Enum):
@@ -46,7 +49,7 @@ class ConfigType(Enum):
     UPGRADE_DEFINITION = "UpgradeDefinition"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationError:
     """Represents a validation error."""
     path: str
@@ -57,7 +60,7 @@ class ValidationError:
         return f"[{self.severity.upper()}] {self.path}: {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating a config file."""
     file_path: str
@@ -76,6 +79,14 @@ class ValidationResult:
         self.warnings.append(ValidationError(path, message, "warning"))
 
 
+# Config file extensions and directories skipped by validate-all
+CONFIG_EXTENSIONS = (".yaml", ".yml", ".json")
+SKIP_DIRS = frozenset({"test", "tests"})
+
+# Below this many files validate-all runs serially
+PARALLEL_MIN_FILES = 8
+
+
 # Schema definitions for each config type
 SCHEMAS: dict[ConfigType, dict[str, Any]] = {
     ConfigType.ERA_CONFIG: {
@@ -154,13 +165,58 @@ SCHEMAS: dict[ConfigType, dict[str, Any]] = {
 }
 
 
+def _compile_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a schema into the lookup structures used by validate_config."""
+    constraints = schema.get("constraints", {})
+    required = schema["required_fields"]
+    optional = schema.get("optional_fields", {})
+
+    def entries(fields: dict[str, Any], is_required: bool) -> tuple:
+        # Expected types are normalized to tuples so isinstance needs no dispatch,
+        # and bounds are pulled out of the constraints dict (None when unbounded)
+        return tuple(
+            (
+                name,
+                etype if isinstance(etype, tuple) else (etype,),
+                constraints.get(name, {}).get("min"),
+                constraints.get(name, {}).get("max"),
+                is_required,
+            )
+            for name, etype in fields.items()
+        )
+
+    return {
+        # (field_name, expected_types, min, max, is_required), required first
+        "fields": entries(required, True) + entries(optional, False),
+        "known_fields": frozenset(required) | frozenset(optional) | {"type"},  # Always allow type field
+        "curve_fields": frozenset(name for name in optional if name.endswith("_curve")),
+        # (list_field, item ConfigType) pairs whose entries are validated as that type
+        "nested": tuple(
+            (name, _TYPE_LOOKUP[type_name.lower()])
+            for name, type_name in schema.get("nested_schemas", {}).items()
+        ),
+    }
+
+
+# Lower-cased type name -> ConfigType, for the "type" field
+_TYPE_LOOKUP: dict[str, ConfigType] = {ct.value.lower(): ct for ct in ConfigType}
+
+# Display list of config type names, for help and error output
+_TYPE_NAMES = ", ".join(ct.value for ct in ConfigType)
+
+# Schemas precompiled once at import (see _compile_schema)
+COMPILED_SCHEMAS: dict[ConfigType, dict[str, Any]] = {
+    config_type: _compile_schema(schema) for config_type, schema in SCHEMAS.items()
+}
+
+
 def detect_config_type(data: dict[str, Any]) -> Optional[ConfigType]:
     """Detect the config type based on the data structure."""
-    if "type" in data:
-        type_str = data["type"]
-        for config_type in ConfigType:
-            if config_type.value.lower() == type_str.lower():
-                return config_type
+    type_name = data.get("type")
+    if isinstance(type_name, str):
+        config_type = _TYPE_LOOKUP.get(type_name.lower())
+        if config_type:
+            return config_type
 
     # Heuristics based on required fields
     if "archetypes" in data:
@@ -175,212 +231,418 @@ def detect_config_type(data: dict[str, Any]) -> Optional[ConfigType]:
     return None
 
 
+# A field path, either already formatted or as a (path_prefix, field_name) pair
+# that is only joined when an error is actually reported
+FieldPath = str | tuple[str, str]
+
+
+def format_field_path(field_path: FieldPath) -> str:
+    """Format a field path for an error message."""
+    if isinstance(field_path, tuple):
+        path_prefix, field_name = field_path
+        return f"{path_prefix}.{field_name}" if path_prefix else field_name
+    return field_path
+
+
 def validate_field_type(
     value: Any,
     expected_type: type | tuple[type, ...],
-    field_path: str,
+    field_path: FieldPath,
     result: ValidationResult
 ) -> bool:
     """Validate that a field has the expected type."""
+    if not isinstance(value, expected_type):
+        result.add_error(format_field_path(field_path), _type_error_message(value, expected_type))
+        return False
+    return True
+
+
+def _type_error_message(value: Any, expected_type: type | tuple[type, ...]) -> str:
+    """Build the message for a type mismatch; only called once a check has failed."""
     if isinstance(expected_type, tuple):
-        if not isinstance(value, expected_type):
-            type_names = " or ".join(t.__name__ for t in expected_type)
-            result.add_error(
-                field_path,
-                f"Expected {type_names}, got {type(value).__name__}"
-            )
-            return False
+        type_names = " or ".join(t.__name__ for t in expected_type)
     else:
-        if not isinstance(value, expected_type):
-            result.add_error(
-                field_path,
-                f"Expected {expected_type.__name__}, got {type(value).__name__}"
-            )
-            return False
-    return True
+        type_names = expected_type.__name__
+    return f"Expected {type_names}, got {type(value).__name__}"
 
 
 def validate_constraints(
     value: Any,
     constraints: dict[str, Any],
-    field_path: str,
+    field_path: FieldPath,
     result: ValidationResult
 ) -> None:
     """Validate numeric constraints on a field."""
-    if not isinstance(value, (int, float)):
+    value_type = type(value)
+    if value_type is not int and value_type is not float and not isinstance(value, _NUM_TYPES):
         return
 
-    if "min" in constraints and value < constraints["min"]:
+    cmin = constraints.get("min")
+    if cmin is not None and value < cmin:
         result.add_error(
-            field_path,
-            f"Value {value} is below minimum {constraints['min']}"
+            format_field_path(field_path),
+            f"Value {value} is below minimum {cmin}"
         )
 
-    if "max" in constraints and value > constraints["max"]:
+    cmax = constraints.get("max")
+    if cmax is not None and value > cmax:
         result.add_error(
-            field_path,
-            f"Value {value} exceeds maximum {constraints['max']}"
+            format_field_path(field_path),
+            f"Value {value} exceeds maximum {cmax}"
         )
 
 
+# Exact types accepted by the validate_curve fast path; anything else
+# (bools, subclasses) falls back to the isinstance-based per-point checks
+_NUM_TYPES = (int, float)
+_POINT_TYPES = (list, tuple)
+
+
 def validate_curve(
     curve: list,
-    field_path: str,
+    field_path: FieldPath,
     result: ValidationResult
 ) -> None:
     """Validate an animation curve definition (list of [x, y] pairs)."""
     if not isinstance(curve, list):
-        result.add_error(field_path, "Curve must be a list of [x, y] pairs")
+        result.add_error(format_field_path(field_path), "Curve must be a list of [x, y] pairs")
+        return
+
+    # Fast path: a curve of well-formed numeric points needs no per-point error work
+    if all(
+        type(point) in _POINT_TYPES and len(point) == 2
+        and type(point[0]) in _NUM_TYPES and type(point[1]) in _NUM_TYPES
+        for point in curve
+    ):
         return
 
     for index, point in enumerate(curve):
-        point_path = f"{field_path}[{index}]"
         if not isinstance(point, (list, tuple)) or len(point) != 2:
-            result.add_error(point_path, "Each curve point must be [x, y]")
+            result.add_error(f"{format_field_path(field_path)}[{index}]", "Each curve point must be [x, y]")
             continue
 
         x_val, y_val = point
         if not isinstance(x_val, (int, float)):
-            result.add_error(f"{point_path}[0]", f"X value must be numeric, got {type(x_val).__name__}")
+            result.add_error(
+                f"{format_field_path(field_path)}[{index}][0]",
+                f"X value must be numeric, got {type(x_val).__name__}"
+            )
         if not isinstance(y_val, (int, float)):
-            result.add_error(f"{point_path}[1]", f"Y value must be numeric, got {type(y_val).__name__}")
+            result.add_error(
+                f"{format_field_path(field_path)}[{index}][1]",
+                f"Y value must be numeric, got {type(y_val).__name__}"
+            )
+
+
+def _make_validator(compiled: dict[str, Any]) -> Callable[..., None]:
+    """
+    Build the validator for one compiled schema. The field table and field sets
+    are bound as closure variables, so validating a config does no schema lookups.
+    """
+    fields = compiled["fields"]
+    curve_fields = compiled["curve_fields"]
+    known_fields = compiled["known_fields"]
+
+    def validate(
+        data: dict[str, Any],
+        result: ValidationResult,
+        path_prefix: str = "",
+        emit_warnings: bool = True
+    ) -> None:
+        add_error = result.add_error
+
+        # Type and constraint checks are inlined here rather than calling
+        # validate_field_type/validate_constraints, as this runs for every field
+        for field_name, expected_types, cmin, cmax, is_required in fields:
+            if field_name not in data:
+                if is_required:
+                    add_error(
+                        format_field_path((path_prefix, field_name)),
+                        f"Required field '{field_name}' is missing"
+                    )
+                continue
+
+            value = data[field_name]
+            if value is None and not is_required:
+                continue
+
+            if not isinstance(value, expected_types):
+                add_error(
+                    format_field_path((path_prefix, field_name)),
+                    _type_error_message(value, expected_types)
+                )
+
+            # Exact type checks first as the cheap common case; subclasses (bools
+            # included) still fall through to isinstance and are bounds-checked
+            value_type = type(value)
+            if value_type is int or value_type is float or isinstance(value, _NUM_TYPES):
+                if cmin is not None and value < cmin:
+                    add_error(
+                        format_field_path((path_prefix, field_name)),
+                        f"Value {value} is below minimum {cmin}"
+                    )
+                if cmax is not None and value > cmax:
+                    add_error(
+                        format_field_path((path_prefix, field_name)),
+                        f"Value {value} exceeds maximum {cmax}"
+                    )
+
+            # Validate curves
+            if field_name in curve_fields and isinstance(value, list):
+                validate_curve(value, (path_prefix, field_name), result)
+
+        # Check for unknown fields (warning only)
+        if emit_warnings and not known_fields.issuperset(data):
+            for field_name in data:
+                if field_name not in known_fields:
+                    field_path = format_field_path((path_prefix, field_name))
+                    result.add_warning(field_path, f"Unknown field '{field_name}'")
+
+    return validate
+
+
+# Specialized validator per config type, dispatched by validate_config
+_VALIDATORS: dict[ConfigType, Callable[..., None]] = {
+    config_type: _make_validator(compiled) for config_type, compiled in COMPILED_SCHEMAS.items()
+}
 
 
 def validate_config(
     data: dict[str, Any],
     config_type: ConfigType,
     result: ValidationResult,
-    path_prefix: str = ""
+    path_prefix: str = "",
+    emit_warnings: bool = True
 ) -> None:
-    """Validate a config dictionary against its schema."""
-    schema = SCHEMAS.get(config_type)
-    if not schema:
+    """
+    Validate a config dictionary against its schema, including the entries of
+    nested lists (e.g. EraConfig archetypes as UnitArchetype).
+    With emit_warnings=False the unknown-field scan is skipped entirely.
+    """
+    if config_type not in _VALIDATORS:
         result.add_error(path_prefix or "root", f"Unknown config type: {config_type}")
         return
 
-    # Check required fields
-    for field_name, expected_type in schema["required_fields"].items():
-        field_path = f"{path_prefix}.{field_name}" if path_prefix else field_name
-        if field_name not in data:
-            result.add_error(field_path, f"Required field '{field_name}' is missing")
-        else:
-            validate_field_type(data[field_name], expected_type, field_path, result)
+    # Nested configs are walked with an explicit stack rather than recursion.
+    # A dict shared by several entries (e.g. a YAML alias) is validated once.
+    stack = [(data, config_type, path_prefix)]
+    seen: set[tuple[int, ConfigType]] = set()
+    while stack:
+        data, config_type, path_prefix = stack.pop()
+        _VALIDATORS[config_type](data, result, path_prefix, emit_warnings)
+
+        children = []
+        for field_name, item_type in COMPILED_SCHEMAS[config_type]["nested"]:
+            items = data.get(field_name)
+            if not isinstance(items, list):
+                continue  # Missing or wrong type, already reported above
+
+            list_path = format_field_path((path_prefix, field_name))
+            for index, item in enumerate(items):
+                if not isinstance(item, dict):
+                    result.add_error(
+                        f"{list_path}[{index}]", f"Expected dictionary, got {type(item).__name__}"
+                    )
+                    continue
+                key = (id(item), item_type)
+                if key not in seen:
+                    seen.add(key)
+                    children.append((item, item_type, f"{list_path}[{index}]"))
+
+        # Pushed in reverse so children are validated (and reported) in order
+        stack.extend(reversed(children))
+
+
+def _get_yaml_loader() -> Optional[type]:
+    """
+    Import PyYAML on first use and return its fastest safe loader
+    (libyaml's CSafeLoader when available), or None if PyYAML is not installed.
+    """
+    global _YAML_LOADER
+    if _YAML_LOADER is None:
+        try:
+            import yaml
+        except ImportError:
+            return None
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return _YAML_LOADER
+
+
+def _get_json_loads() -> Callable[[bytes], Any]:
+    """
+    Return the JSON parse function on first use: orjson.loads if installed,
+    otherwise the standard library's json.loads. Both accept bytes.
+    """
+    global _JSON_LOADS
+    if _JSON_LOADS is None:
+        try:
+            import orjson
+            _JSON_LOADS = orjson.loads
+        except ImportError:
+            import json
+            _JSON_LOADS = json.loads
+    return _JSON_LOADS
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_content(content: bytes, suffix: str) -> Any:
+    """
+    Parse config file content, memoized on the content itself so duplicated
+    configs are parsed once. The returned data is shared and must not be mutated;
+    load_config_file hands callers their own copy.
+    Hit rate is available via _parse_content.cache_info().
+    """
+    if suffix == ".json":
+        return _get_json_loads()(content)
 
-            # Check constraints if applicable
-            if "constraints" in schema and field_name in schema["constraints"]:
-                validate_constraints(
-                    data[field_name],
-                    schema["constraints"][field_name],
-                    field_path,
-                    result
-                )
-
-    # Check optional fields if present
-    for field_name, expected_type in schema.get("optional_fields", {}).items():
-        if field_name in data and data[field_name] is not None:
-            field_path = f"{path_prefix}.{field_name}" if path_prefix else field_name
-            validate_field_type(data[field_name], expected_type, field_path, result)
-
-            # Check constraints if applicable
-            if "constraints" in schema and field_name in schema["constraints"]:
-                validate_constraints(
-                    data[field_name],
-                    schema["constraints"][field_name],
-                    field_path,
-                    result
-                )
-
-            # Validate curves
-            if field_name.endswith("_curve") and isinstance(data[field_name], list):
-                validate_curve(data[field_name], field_path, result)
+    import yaml
 
-    # Check for unknown fields (warning only)
-    known_fields = set(schema["required_fields"].keys()) | set(schema.get("optional_fields", {}).keys())
-    known_fields.add("type")  # Always allow type field
-    for field_name in data:
-        if field_name not in known_fields:
-            field_path = f"{path_prefix}.{field_name}" if path_prefix else field_name
-            result.add_warning(field_path, f"Unknown field '{field_name}'")
+    return yaml.load(content, Loader=_get_yaml_loader())
 
 
-def load_config_file(file_path: Path) -> tuple[Optional[dict], Optional[str]]:
-    """Load a config file (YAML or JSON)."""
+def _load_content(content: bytes, suffix: str) -> tuple[Optional[dict], Optional[str]]:
+    """Parse the raw content of a config file with the given (lower-case) suffix."""
     try:
-        content = file_path.read_text()
-        suffix = file_path.suffix.lower()
-
         if suffix in (".yaml", ".yml"):
-            if not YAML_AVAILABLE:
+            if _get_yaml_loader() is None:
                 return None, "PyYAML is not installed. Run: pip install pyyaml"
-            return yaml.safe_load(content), None
+            import yaml
+
+            try:
+                return _parse_content(content, suffix), None
+            except yaml.YAMLError as error:
+                return None, f"YAML parsing error: {error}"
+
         elif suffix == ".json":
-            return json.loads(content), None
+            try:
+                return _parse_content(content, suffix), None
+            except UnicodeDecodeError:
+                raise  # Reported as an encoding error below
+            except ValueError as error:
+                # Both json.JSONDecodeError and orjson.JSONDecodeError subclass ValueError
+                return None, f"JSON parsing error: {error}"
+
         else:
             return None, f"Unsupported file extension: {suffix}"
 
-    except yaml.YAMLError as error:
-        return None, f"YAML parsing error: {error}"
-    except json.JSONDecodeError as error:
-        return None, f"JSON parsing error: {error}"
+    except UnicodeDecodeError as error:
+        return None, f"File encoding error: {error}"
+
+
+def load_config_file(file_path: Path) -> tuple[Optional[dict], Optional[str]]:
+    """Load a config file (YAML or JSON). The returned data is the caller's to modify."""
+    try:
+        # Parsers take the raw bytes directly, skipping a separate UTF-8 decode
+        content = file_path.read_bytes()
     except OSError as error:
         return None, f"File read error: {error}"
 
-
-def validate_file(file_path: Path) -> ValidationResult:
-    """Validate a single config file."""
-    result = ValidationResult(file_path=str(file_path), config_type=None)
+    data, error = _load_content(content, file_path.suffix.lower())
+    # Copy out of the parse cache, which files with identical content share
+    return copy.deepcopy(data), error
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_content(
+    content: bytes,
+    suffix: str,
+    emit_warnings: bool
+) -> tuple[Optional[ConfigType], tuple[ValidationError, ...], tuple[ValidationError, ...]]:
+    """
+    Validate config file content, memoized on the content itself so duplicated
+    configs are validated once. Returns (config_type, errors, warnings); the
+    errors and warnings do not depend on the file path.
+    Hit rate is available via _validate_content.cache_info().
+    """
+    result = ValidationResult(file_path="", config_type=None)
 
     # Load the file
-    data, error = load_config_file(file_path)
+    data, error = _load_content(content, suffix)
     if error:
         result.add_error("file", error)
-        return result
-
-    if not isinstance(data, dict):
+    elif not isinstance(data, dict):
         result.add_error("root", f"Expected dictionary, got {type(data).__name__}")
-        return result
+    else:
+        # Detect config type
+        result.config_type = detect_config_type(data)
+        if not result.config_type:
+            result.add_error(
+                "root", "Unable to detect config type. Add 'type' field or use recognizable field names."
+            )
+        else:
+            # Validate against schema
+            validate_config(data, result.config_type, result, emit_warnings=emit_warnings)
 
-    # Detect config type
-    config_type = detect_config_type(data)
-    if not config_type:
-        result.add_error("root", "Unable to detect config type. Add 'type' field or use recognizable field names.")
+    return result.config_type, tuple(result.errors), tuple(result.warnings)
+
+
+def validate_file(file_path: Path, emit_warnings: bool = True) -> ValidationResult:
+    """Validate a single config file."""
+    result = ValidationResult(file_path=str(file_path), config_type=None)
+
+    try:
+        content = file_path.read_bytes()
+    except OSError as error:
+        result.add_error("file", f"File read error: {error}")
         return result
 
+    config_type, errors, warnings = _validate_content(content, file_path.suffix.lower(), emit_warnings)
     result.config_type = config_type
+    result.errors.extend(errors)
+    result.warnings.extend(warnings)
+    return result
 
-    # Validate against schema
-    validate_config(data, config_type, result)
 
-    return result
+def find_config_files(directory: Path) -> list[Path]:
+    """Find all config files under a directory in a single walk, skipping test directories."""
+    found = []
+    pending = [os.fspath(directory)]
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(CONFIG_EXTENSIONS):
+                        found.append(entry.path)
+        except OSError:
+            continue
 
+    return [Path(path) for path in sorted(found)]
 
-def validate_directory(directory: Path) -> list[ValidationResult]:
-    """Validate all config files in a directory."""
-    results = []
-    extensions = [".yaml", ".yml", ".json"]
 
-    for ext in extensions:
-        for file_path in directory.rglob(f"*{ext}"):
-            # Skip test files
-            if "test" in file_path.parts or "tests" in file_path.parts:
-                continue
-            results.append(validate_file(file_path))
+def validate_directory(
+    directory: Path,
+    jobs: Optional[int] = None,
+    emit_warnings: bool = True
+) -> list[ValidationResult]:
+    """
+    Validate all config files in a directory.
+    Files are validated across `jobs` worker processes (default: CPU count);
+    small directories are validated serially to avoid process startup cost.
+    """
+    file_paths = find_config_files(directory)
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1 or len(file_paths) < PARALLEL_MIN_FILES:
+        return [validate_file(file_path, emit_warnings) for file_path in file_paths]
+
+    from concurrent.futures import ProcessPoolExecutor
 
-    return results
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(
+            functools.partial(validate_file, emit_warnings=emit_warnings), file_paths, chunksize=16
+        ))
 
 
 def print_schema(config_type_name: str) -> None:
     """Print the schema for a config type."""
-    # Find matching config type
-    config_type = None
-    for cfg_type in ConfigType:
-        if cfg_type.value.lower() == config_type_name.lower():
-            config_type = cfg_type
-            break
-
+    config_type = _TYPE_LOOKUP.get(config_type_name.lower())
     if not config_type:
         print(f"Unknown config type: {config_type_name}")
-        print("Available types:", ", ".join(ct.value for ct in ConfigType))
+        print("Available types:", _TYPE_NAMES)
         return
 
     schema = SCHEMAS[config_type]
@@ -457,8 +719,29 @@ cost: 100
 """)
 
 
+def parse_jobs(value: str) -> int:
+    """Parse a positive worker-process count for --jobs."""
+    import argparse
+
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"invalid job count: {value!r} (must be a positive integer)")
+    return jobs
+
+
 def main() -> int:
     """Main entry point."""
+    # Fast path: `schema <type>` needs neither argparse nor a config parser
+    argv = sys.argv[1:]
+    if len(argv) == 2 and argv[0] == "schema" and not argv[1].startswith("-"):
+        print_schema(argv[1])
+        return 0
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Relic ScriptableObject Config Validator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -470,14 +753,26 @@ def main() -> int:
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate a config file")
     validate_parser.add_argument("file", type=Path, help="Config file to validate")
+    validate_parser.add_argument(
+        "--no-warnings", action="store_true",
+        help="Skip unknown-field warnings"
+    )
 
     # Validate-all command
     validate_all_parser = subparsers.add_parser("validate-all", help="Validate all configs in directory")
     validate_all_parser.add_argument("directory", type=Path, help="Directory containing configs")
+    validate_all_parser.add_argument(
+        "--jobs", "-j", type=parse_jobs, default=None,
+        help="Worker processes (default: CPU count, 1 = serial)"
+    )
+    validate_all_parser.add_argument(
+        "--no-warnings", action="store_true",
+        help="Skip unknown-field warnings"
+    )
 
     # Schema command
     schema_parser = subparsers.add_parser("schema", help="Print schema for a config type")
-    schema_parser.add_argument("type", help="Config type (EraConfig, UnitArchetype, WeaponStats, UpgradeDefinition)")
+    schema_parser.add_argument("type", help=f"Config type ({_TYPE_NAMES})")
 
     args = parser.parse_args()
 
@@ -486,7 +781,7 @@ def main() -> int:
             print(f"Error: File not found: {args.file}")
             return 1
 
-        result = validate_file(args.file)
+        result = validate_file(args.file, emit_warnings=not args.no_warnings)
         print(f"\nValidating: {result.file_path}")
         print(f"Detected type: {result.config_type.value if result.config_type else 'Unknown'}")
 
@@ -509,42 +804,43 @@ def main() -> int:
             print(f"Error: Directory not found: {args.directory}")
             return 1
 
-        results = validate_directory(args.directory)
+        results = validate_directory(args.directory, jobs=args.jobs, emit_warnings=not args.no_warnings)
         if not results:
             print("No config files found")
             return 0
 
+        # Output is collected and written once; validate-all can report thousands of files
+        parts = []
         total_errors = 0
         total_warnings = 0
         failed_files = []
 
         for result in results:
-            print(f"\n{result.file_path}: ", end="")
+            parts.append(f"\n{result.file_path}: ")
             if result.is_valid:
-                print("✓ OK", end="")
                 if result.warnings:
-                    print(f" ({len(result.warnings)} warnings)")
+                    parts.append(f"✓ OK ({len(result.warnings)} warnings)\n")
                 else:
-                    print()
+                    parts.append("✓ OK\n")
             else:
-                print(f"✗ FAILED ({len(result.errors)} errors)")
+                parts.append(f"✗ FAILED ({len(result.errors)} errors)\n")
                 failed_files.append(result.file_path)
                 for error in result.errors:
-                    print(f"    {error}")
+                    parts.append(f"    {error}\n")
 
             total_errors += len(result.errors)
             total_warnings += len(result.warnings)
 
-        print(f"\n{'=' * 40}")
-        print(f"Total: {len(results)} files, {total_errors} errors, {total_warnings} warnings")
+        parts.append(f"\n{'=' * 40}\n")
+        parts.append(f"Total: {len(results)} files, {total_errors} errors, {total_warnings} warnings\n")
 
         if failed_files:
-            print(f"\nFailed files:")
+            parts.append("\nFailed files:\n")
             for file_path in failed_files:
-                print(f"  - {file_path}")
-            return 1
+                parts.append(f"  - {file_path}\n")
 
-        return 0
+        sys.stdout.write("".join(parts))
+        return 1 if failed_files else 0
 
     elif args.command == "schema":
         print_schema(args.type)
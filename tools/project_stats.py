@@ -26,13 +26,16 @@ Example:
 """
 
 import argparse
+import heapq
 import json
+import os
 import re
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 
 
 # File extension categories
@@ -50,8 +53,37 @@ EXTENSION_CATEGORIES = {
     "docs": [".md", ".txt", ".rst"],
 }
 
+# Extension -> category, flattened from EXTENSION_CATEGORIES for get_category.
+# The values are the category literals above, which the compiler interns, so
+# every file's category is the same str object as its stats.categories key.
+_SUFFIX_TO_CATEGORY: dict[str, str] = {
+    ext: category for category, extensions in EXTENSION_CATEGORIES.items() for ext in extensions
+}
+
+# Lower-cased era name as found in paths -> display name used in era_breakdown
+ERA_NAMES = {"ancient": "Ancient", "medieval": "Medieval", "wwii": "WWII", "future": "Future"}
+_ERA_RE = re.compile(r"(ancient|medieval|wwii|future)", re.IGNORECASE)
+
+# Categories whose files are line-counted, except for suffixes in UNCOUNTED_SUFFIXES
+# (Unity .asset files are serialized YAML, not hand-written config)
+LINE_COUNTED_CATEGORIES = frozenset({"code", "config", "docs"})
+UNCOUNTED_SUFFIXES = frozenset({".asset"})
+
+# Files larger than this only get a total line count, with every line counted as code
+MAX_COUNT_BYTES = 2 * 1024 * 1024
+
+# Directories never descended into by collect_stats (hidden directories are skipped too)
+SKIP_DIRS = frozenset({
+    ".git", "node_modules", "__pycache__", ".pytest_cache", "Library", "Temp", "Logs", "obj",
+})
 
-@dataclass
+# Below this many files collect_stats runs serially; otherwise files are sent to
+# the workers in chunks of PARALLEL_CHUNK_SIZE, with at most one worker per chunk
+PARALLEL_MIN_FILES = 256
+PARALLEL_CHUNK_SIZE = 64
+
+
+@dataclass(slots=True)
 class FileStats:
     """Statistics for a single file."""
     path: Path
@@ -60,9 +92,21 @@ class FileStats:
     comment_lines: int = 0
     blank_lines: int = 0
     size_bytes: int = 0
+    rel_path: str = ""  # Path relative to the project root, for reports
+
+
+class LineCounts(NamedTuple):
+    """Line counts for one file, as returned by count_lines."""
+    total: int
+    code: int
+    comments: int
+    blank: int
 
 
-@dataclass
+_NO_LINES = LineCounts(0, 0, 0, 0)
+
+
+@dataclass(slots=True)
 class CategoryStats:
     """Aggregated statistics for a file category."""
     category: str
@@ -75,7 +119,7 @@ class CategoryStats:
     files: list[FileStats] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectStats:
     """Complete project statistics."""
     root_path: Path
@@ -118,168 +162,233 @@ class ProjectStats:
         }
 
 
-def get_category(file_path: Path) -> str:
+def get_category(file_path: str | Path) -> str:
     """Determine the category of a file based on its extension."""
-    suffix = file_path.suffix.lower()
-    for category, extensions in EXTENSION_CATEGORIES.items():
-        if suffix in extensions:
-            return category
-    return "other"
+    return _SUFFIX_TO_CATEGORY.get(os.path.splitext(file_path)[1].lower(), "other")
+
+
+# Line classification patterns. They run over whole files as bytes, with every
+# line framed as b"\n" + line (see count_lines), so matches start at a literal
+# newline instead of a MULTILINE ^ tried at every position.
+# "Whitespace" is what str.strip() removes from an ASCII line.
+_BLANK_LINE_RE = re.compile(rb"\n(?=[ \t\r\f\v]*\n)")
+_HASH_COMMENT_RE = re.compile(rb"\n[ \t\r\f\v]*#")
+_PY_COMMENT_RE = re.compile(rb"\n[ \t\r\f\v]*(?:#|\"\"\"|\'\'\')")
+# A // line, or a block comment opened at the start of a line and running to the
+# end of the line holding its closing */ (or to the end of the file if unclosed).
+# The group captures a block comment's text after /* and is empty for // lines.
+_CS_COMMENT_RE = re.compile(rb"\n[ \t\r\f\v]*(?://|/\*((?:.*?\*/|.*)[^\n]*))", re.DOTALL)
+
+
+def _count_cs_comments(text: bytes) -> int:
+    """Count non-blank C# comment lines (// lines and line-initial /* */ blocks)."""
+    bodies = _CS_COMMENT_RE.findall(text)
+    if not bodies:
+        return 0
+
+    # Each match is one comment line, plus the non-blank continuation lines of
+    # multi-line blocks. The bodies are joined with a non-blank separator so all
+    # continuation lines can be counted in one pass.
+    joined = b"\n*".join(bodies)
+    if joined.endswith(b"\n"):
+        joined = joined[:-1]  # An unclosed block runs into the final line terminator
+    continuation = joined.count(b"\n") - (len(bodies) - 1)
+    blank = len(_BLANK_LINE_RE.findall(joined + b"\n"))
+    return len(bodies) + continuation - blank
+
+
+def _count_py_comments(text: bytes) -> int:
+    """Count Python/Shell comment lines (# lines and lines opening a docstring)."""
+    return len(_PY_COMMENT_RE.findall(text))
+
+
+def _count_hash_comments(text: bytes) -> int:
+    """Count # comment lines."""
+    return len(_HASH_COMMENT_RE.findall(text))
 
 
-def count_lines(file_path: Path) -> tuple[int, int, int, int]:
+# Comment counter per suffix; for other files every non-blank line is code
+_COMMENT_COUNTERS = {
+    ".cs": _count_cs_comments,
+    ".py": _count_py_comments,
+    ".sh": _count_py_comments,
+    ".yaml": _count_hash_comments,
+    ".yml": _count_hash_comments,
+}
+
+
+def count_lines(file_path: str | Path) -> LineCounts:
     """
     Count lines in a file.
-    Returns (total, code, comments, blank).
+    Returns LineCounts(total, code, comments, blank).
+
+    The whole file is classified by bytes.count and the compiled patterns
+    above, so no Python code runs per line.
     """
     try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-    except (OSError, UnicodeDecodeError):
-        return 0, 0, 0, 0
-
-    lines = content.splitlines()
-    total = len(lines)
-    blank = sum(1 for line in lines if not line.strip())
-    comment = 0
-    code = 0
-
-    # Detect language for comment patterns
-    suffix = file_path.suffix.lower()
-    in_multiline_comment = False
-
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
+        with open(file_path, "rb") as file:
+            content = file.read()
+    except OSError:
+        return _NO_LINES
 
-        if suffix == ".cs":
-            # C# comments
-            if in_multiline_comment:
-                comment += 1
-                if "*/" in stripped:
-                    in_multiline_comment = False
-            elif stripped.startswith("/*"):
-                comment += 1
-                if "*/" not in stripped:
-                    in_multiline_comment = True
-            elif stripped.startswith("//"):
-                comment += 1
-            else:
-                code += 1
-
-        elif suffix in (".py", ".sh"):
-            # Python/Shell comments
-            if stripped.startswith("#"):
-                comment += 1
-            elif stripped.startswith('"""') or stripped.startswith("'''"):
-                # Docstrings - count as comments
-                comment += 1
-            else:
-                code += 1
-
-        elif suffix in (".yaml", ".yml"):
-            # YAML comments
-            if stripped.startswith("#"):
-                comment += 1
-            else:
-                code += 1
-
-        elif suffix == ".md":
-            # Markdown - all is "code" (content)
-            code += 1
+    if not content:
+        return _NO_LINES
 
-        else:
-            # Default: everything non-blank is code
-            code += 1
+    # Frame every line as b"\n" + line, ending with a newline
+    text = b"\n" + content if content.endswith(b"\n") else b"\n" + content + b"\n"
+    total = text.count(b"\n") - 1
+    blank = len(_BLANK_LINE_RE.findall(text))
+
+    counter = _COMMENT_COUNTERS.get(os.path.splitext(file_path)[1].lower())
+    comment = counter(text) if counter else 0
 
-    return total, code, comment, blank
+    return LineCounts(total, total - blank - comment, comment, blank)
 
 
-def detect_era_from_path(file_path: Path) -> Optional[str]:
+def count_newlines(file_path: str | Path) -> int:
+    """Count lines in a file by reading it in fixed-size chunks, without classifying them."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return 0
+
+    total = 0
+    last_chunk = b""
+    try:
+        for chunk in iter(lambda: os.read(fd, 65536), b""):
+            total += chunk.count(b"\n")
+            last_chunk = chunk
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+    # A final line without a trailing newline still counts
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        total += 1
+    return total
+
+
+def detect_era_from_path(file_path: str | Path) -> Optional[str]:
     """Detect the era from file path components."""
-    era_names = ["ancient", "medieval", "wwii", "future"]
-    path_str = str(file_path).lower()
+    match = _ERA_RE.search(os.fspath(file_path))
+    return ERA_NAMES[match.group(1).lower()] if match else None
+
+
+def iter_project_files(root_path: Path) -> Iterator[tuple[str, str, int]]:
+    """
+    Yield (path, path relative to root_path, size in bytes) for the files under
+    root_path, skipping hidden entries and SKIP_DIRS. Walks with os.scandir, so
+    entry types come from the directory listing and skipped directories are
+    never opened.
+    """
+    pending: list[tuple[str, str]] = [(os.fspath(root_path), "")]
+    while pending:
+        dir_path, rel_prefix = pending.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in SKIP_DIRS:
+                                pending.append((entry.path, rel_prefix + name + os.sep))
+                        elif entry.is_file():
+                            yield entry.path, rel_prefix + name, entry.stat().st_size
+                    except OSError:
+                        continue  # e.g. removed while walking
+        except OSError:
+            continue
 
-    for era in era_names:
-        if era in path_str:
-            return era.capitalize()
 
-    return None
+def classify_file(path: str, size: int) -> tuple[str, int, int, int, int, Optional[str]]:
+    """
+    Gather the per-file statistics for collect_stats, using str paths throughout.
+    Returns (category, total, code, comments, blank, era).
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    category = _SUFFIX_TO_CATEGORY.get(suffix, "other")
+
+    # Count lines for text files; very large ones only get a newline count
+    total, code, comments, blank = 0, 0, 0, 0
+    if category in LINE_COUNTED_CATEGORIES and suffix not in UNCOUNTED_SUFFIXES:
+        if size > MAX_COUNT_BYTES:
+            total = code = count_newlines(path)
+        else:
+            total, code, comments, blank = count_lines(path)
 
+    return category, total, code, comments, blank, detect_era_from_path(path)
 
-def collect_stats(root_path: Path) -> ProjectStats:
-    """Collect statistics for the entire project."""
+
+def collect_stats(
+    root_path: Path,
+    jobs: Optional[int] = None,
+    keep_files: Optional[set[str]] = None
+) -> ProjectStats:
+    """
+    Collect statistics for the entire project.
+    Files are classified across `jobs` worker processes (default: CPU count);
+    small projects are processed serially to avoid process startup cost.
+    Per-file FileStats are kept only for the categories in `keep_files`
+    (default: all categories).
+    """
     stats = ProjectStats(root_path=root_path)
 
     # Initialize categories
     for category in list(EXTENSION_CATEGORIES.keys()) + ["other"]:
         stats.categories[category] = CategoryStats(category=category)
 
-    # Initialize era breakdown
-    for era in ["Ancient", "Medieval", "WWII", "Future"]:
-        stats.era_breakdown[era] = defaultdict(int)
-
-    # Skip directories
-    skip_dirs = {".git", "node_modules", "__pycache__", ".pytest_cache", "Library", "Temp", "Logs", "obj"}
-
-    for file_path in root_path.rglob("*"):
-        # Skip non-files
-        if not file_path.is_file():
-            continue
+    # Era breakdown is counted in a flat era x category grid, converted below
+    era_index = {era: index for index, era in enumerate(ERA_NAMES.values())}
+    category_index = {category: index for index, category in enumerate(stats.categories)}
+    era_counts = [[0] * len(category_index) for _ in era_index]
 
-        # Skip hidden files and directories in skip list
-        parts = file_path.parts
-        if any(part.startswith(".") for part in parts):
-            if ".git" not in parts:  # Allow other hidden files
-                continue
-        if any(skip_dir in parts for skip_dir in skip_dirs):
-            continue
+    walked = list(iter_project_files(root_path))
+    jobs = jobs or os.cpu_count() or 1
 
-        category = get_category(file_path)
-        cat_stats = stats.categories[category]
+    if jobs == 1 or len(walked) < PARALLEL_MIN_FILES:
+        classified = [classify_file(path, size) for path, _, size in walked]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
 
-        # Get file size
-        try:
-            size = file_path.stat().st_size
-        except OSError:
-            size = 0
-
-        # Count lines for text files
-        total, code, comments, blank = 0, 0, 0, 0
-        if category in ("code", "config", "docs"):
-            total, code, comments, blank = count_lines(file_path)
-
-        # Create file stats
-        file_stats = FileStats(
-            path=file_path,
-            lines=total,
-            code_lines=code,
-            comment_lines=comments,
-            blank_lines=blank,
-            size_bytes=size,
-        )
+        paths = [path for path, _, _ in walked]
+        sizes = [size for _, _, size in walked]
+        workers = min(jobs, -(-len(paths) // PARALLEL_CHUNK_SIZE))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            classified = list(executor.map(classify_file, paths, sizes, chunksize=PARALLEL_CHUNK_SIZE))
 
+    for (path, rel_path, size), (category, total, code, comments, blank, era) in zip(walked, classified):
         # Update category stats
+        cat_stats = stats.categories[category]
         cat_stats.file_count += 1
         cat_stats.total_lines += total
         cat_stats.code_lines += code
         cat_stats.comment_lines += comments
         cat_stats.blank_lines += blank
         cat_stats.total_size_bytes += size
-        cat_stats.files.append(file_stats)
+        if keep_files is None or category in keep_files:
+            cat_stats.files.append(FileStats(
+                path=Path(path),
+                lines=total,
+                code_lines=code,
+                comment_lines=comments,
+                blank_lines=blank,
+                size_bytes=size,
+                rel_path=rel_path,
+            ))
 
         # Update era breakdown
-        era = detect_era_from_path(file_path)
         if era:
-            stats.era_breakdown[era][category] += 1
+            era_counts[era_index[era]][category_index[category]] += 1
+
+    # Files per top-level directory (root-level files count under their own name)
+    stats.directory_structure = dict(Counter(rel_path.partition(os.sep)[0] for _, rel_path, _ in walked))
 
-        # Update directory structure
-        if len(file_path.parts) > len(root_path.parts):
-            relative_parts = file_path.relative_to(root_path).parts
-            if len(relative_parts) >= 1:
-                top_dir = relative_parts[0]
-                if top_dir not in skip_dirs:
-                    stats.directory_structure[top_dir] = stats.directory_structure.get(top_dir, 0) + 1
+    categories = list(category_index)
+    for era, counts in zip(era_index, era_counts):
+        stats.era_breakdown[era] = {categories[index]: count for index, count in enumerate(counts) if count}
 
     return stats
 
@@ -336,10 +445,8 @@ def print_code_stats(stats: ProjectStats, verbose: bool = False) -> None:
     if verbose and code_cat.files:
         print("\nLargest Files:")
         print("-" * 40)
-        sorted_files = sorted(code_cat.files, key=lambda x: -x.lines)[:10]
-        for file_stat in sorted_files:
-            rel_path = file_stat.path.relative_to(stats.root_path)
-            print(f"  {file_stat.lines:6} lines  {rel_path}")
+        for file_stat in heapq.nlargest(10, code_cat.files, key=attrgetter("lines")):
+            print(f"  {file_stat.lines:6} lines  {file_stat.rel_path}")
 
 
 def print_asset_stats(stats: ProjectStats, by_era: bool = False) -> None:
@@ -383,9 +490,8 @@ def print_docs_stats(stats: ProjectStats) -> None:
     if docs_cat.files:
         print("\nDocument Files:")
         print("-" * 40)
-        for file_stat in sorted(docs_cat.files, key=lambda x: -x.lines):
-            rel_path = file_stat.path.relative_to(stats.root_path)
-            print(f"  {file_stat.lines:6} lines  {rel_path}")
+        for file_stat in sorted(docs_cat.files, key=attrgetter("lines"), reverse=True):
+            print(f"  {file_stat.lines:6} lines  {file_stat.rel_path}")
 
     # Documentation coverage check
     expected_docs = [
@@ -418,6 +524,35 @@ def print_directory_structure(stats: ProjectStats) -> None:
         print(f"  {dirname:20} {count} files")
 
 
+def print_json(stats: ProjectStats) -> None:
+    """
+    Write the statistics to stdout as indented JSON. Uses orjson when installed,
+    otherwise streams the standard json encoder's output to stdout.
+    """
+    data = stats.to_dict()
+    try:
+        import orjson
+    except ImportError:
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
+
+
+def parse_jobs(value: str) -> int:
+    """Parse a positive worker-process count for --jobs."""
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"invalid job count: {value!r} (must be a positive integer)")
+    return jobs
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -448,6 +583,10 @@ def main() -> int:
     # Common arguments
     parser.add_argument("--path", "-p", type=Path, default=None, help="Project root path")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--jobs", type=parse_jobs, default=None,
+        help="Worker processes (default: CPU count, 1 = serial)"
+    )
 
     args = parser.parse_args()
 
@@ -465,12 +604,22 @@ def main() -> int:
         print(f"Error: Path not found: {root_path}")
         return 1
 
+    # Only the code and docs reports list individual files
+    if args.json:
+        keep_files = set()
+    elif args.command == "code":
+        keep_files = {"code"}
+    elif args.command == "docs":
+        keep_files = {"docs"}
+    else:
+        keep_files = set()
+
     # Collect statistics
-    stats = collect_stats(root_path)
+    stats = collect_stats(root_path, jobs=args.jobs, keep_files=keep_files)
 
     # Handle JSON output
     if args.json:
-        print(json.dumps(stats.to_dict(), indent=2))
+        print_json(stats)
         return 0
 
     # Handle commands
@@ -0,0 +1,27 @@
+"""Shared pytest setup for the tool tests."""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the tools importable as top-level modules (once per test process, so
+# each pytest-xdist worker sets it up for itself)
+TOOLS_DIR = str(Path(__file__).parent.parent)
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+
+@pytest.fixture(scope="session")
+def sample_dir(tmp_path_factory):
+    """One directory shared by every test that writes a sample file."""
+    return tmp_path_factory.mktemp("samples")
+
+
+@pytest.fixture
+def sample_path(sample_dir, request):
+    """Return a path in sample_dir unique to the requesting test."""
+    # Parametrize ids can hold characters that are not valid in file names
+    name = re.sub(r"[^\w.\[\]-]", "_", request.node.name)
+    return lambda suffix: sample_dir / f"{name}{suffix}"
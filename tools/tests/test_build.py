@@ -1,26 +1,65 @@
 """Tests for the build automation tool."""
 
+import argparse
 import os
+import platform
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
-# Import the module under test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from build import (
     PROFILES,
     TARGETS,
+    _cached_unity_executable,
+    _find_adb,
+    _save_unity_cache,
+    _spawn_wait,
     find_unity_executable,
     get_project_root,
     check_prerequisites,
-    generate_build_script,
+    clean_staging,
+    get_build_args,
+    get_staging_path,
+    parse_profiles,
+    prepare_profile_workdir,
+    run_unity_build,
+    install_apk,
+    main,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_lookup_caches():
+    """Reset the memoized lookups so each test's patches take effect."""
+    find_unity_executable.cache_clear()
+    get_project_root.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def project_without_scenes(tmp_path_factory):
+    """A project tree with Assets/ and ProjectSettings/ but no scenes, shared by the module."""
+    project_root = tmp_path_factory.mktemp("project_without_scenes")
+    (project_root / "Assets").mkdir()
+    (project_root / "ProjectSettings").mkdir()
+    return project_root
+
+
+@pytest.fixture(scope="module")
+def complete_project(tmp_path_factory):
+    """A project tree with every scene the build targets need, shared by the module."""
+    project_root = tmp_path_factory.mktemp("complete_project")
+    (project_root / "ProjectSettings").mkdir()
+    scenes_dir = project_root / "Assets" / "Scenes"
+    scenes_dir.mkdir(parents=True)
+    (scenes_dir / "AR_Battlefield.unity").write_text("")
+    (scenes_dir / "Flat_Debug.unity").write_text("")
+    return project_root
+
+
 class TestProfiles:
     """Tests for build profile configurations."""
 
@@ -59,6 +98,13 @@ class TestTargets:
 class TestFindUnityExecutable:
     """Tests for Unity executable detection."""
 
+    @pytest.fixture(autouse=True)
+    def home(self, tmp_path):
+        """Point detection and its cache at a temporary home, never the real one."""
+        with patch("build._HOME", tmp_path), \
+                patch("build.UNITY_CACHE_FILE", tmp_path / ".cache/relic/unity_path.json"):
+            yield tmp_path
+
     def test_returns_path_from_environment(self):
         with patch.dict(os.environ, {"UNITY_PATH": "/path/to/Unity"}):
             with patch("pathlib.Path.exists", return_value=True):
@@ -86,6 +132,41 @@ class TestFindUnityExecutable:
                 if env_backup:
                     os.environ["UNITY_PATH"] = env_backup
 
+    @pytest.mark.skipif(platform.system() != "Linux", reason="Uses Linux Hub layout")
+    def test_caches_detected_path(self, home):
+        unity_exe = home / "Unity/Hub/Editor/6000.0.3f1/Editor/Unity"
+        unity_exe.parent.mkdir(parents=True)
+        unity_exe.write_text("")
+
+        with patch.dict(os.environ, {}, clear=True):
+            assert find_unity_executable() == unity_exe
+            assert (home / ".cache/relic/unity_path.json").exists()
+
+            # Disk cache hit: the version directory is not rescanned
+            find_unity_executable.cache_clear()
+            with patch("build.os.scandir", side_effect=AssertionError("rescanned")):
+                assert find_unity_executable() == unity_exe
+
+    def test_cache_invalidated_by_install_under_earlier_path(self, home):
+        preferred, fallback = home / "Hub/Editor", home / "opt/unity"
+        unity_exe = fallback / "6000.0.1f1/Editor/Unity"
+        unity_exe.parent.mkdir(parents=True)
+        unity_exe.write_text("")
+        possible_paths = [preferred, fallback]
+
+        _save_unity_cache("Linux", possible_paths, unity_exe)
+        assert _cached_unity_executable("Linux", possible_paths) == unity_exe
+
+        (preferred / "6000.0.3f1/Editor").mkdir(parents=True)
+        assert _cached_unity_executable("Linux", possible_paths) is None
+
+    def test_memoizes_lookup(self):
+        with patch.dict(os.environ, {"UNITY_PATH": "/path/to/Unity"}):
+            with patch("pathlib.Path.exists", return_value=True) as exists:
+                assert find_unity_executable() == Path("/path/to/Unity")
+                assert find_unity_executable() == Path("/path/to/Unity")
+                assert exists.call_count == 1
+
 
 class TestGetProjectRoot:
     """Tests for project root detection."""
@@ -118,14 +199,9 @@ class TestGetProjectRoot:
 class TestCheckPrerequisites:
     """Tests for build prerequisite checking."""
 
-    def test_reports_missing_unity(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_root = Path(tmp_dir)
-            (project_root / "Assets").mkdir()
-            (project_root / "ProjectSettings").mkdir()
-
-            issues = check_prerequisites(None, project_root)
-            assert any("Unity executable not found" in issue for issue in issues)
+    def test_reports_missing_unity(self, project_without_scenes):
+        issues = check_prerequisites(None, project_without_scenes)
+        assert any("Unity executable not found" in issue for issue in issues)
 
     def test_reports_missing_assets_directory(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -143,120 +219,246 @@ class TestCheckPrerequisites:
             issues = check_prerequisites(Path("/some/unity"), project_root)
             assert any("ProjectSettings/ directory not found" in issue for issue in issues)
 
-    def test_reports_missing_scenes(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_root = Path(tmp_dir)
-            (project_root / "Assets").mkdir()
-            (project_root / "ProjectSettings").mkdir()
+    def test_reports_missing_scenes(self, project_without_scenes):
+        issues = check_prerequisites(Path("/some/unity"), project_without_scenes)
+        # Should report missing scene files
+        assert any("Scene not found" in issue for issue in issues)
 
-            issues = check_prerequisites(Path("/some/unity"), project_root)
-            # Should report missing scene files
-            assert any("Scene not found" in issue for issue in issues)
+    def test_no_issues_when_complete(self, complete_project):
+        # Mock Unity existence
+        with patch("pathlib.Path.exists", return_value=True):
+            unity_path = Path("/path/to/Unity")
+            issues = check_prerequisites(unity_path, complete_project)
+            # May still have issues for scenes depending on target configs
 
-    def test_no_issues_when_complete(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_root = Path(tmp_dir)
-            (project_root / "Assets").mkdir()
-            (project_root / "ProjectSettings").mkdir()
 
-            # Create scene files
-            scenes_dir = project_root / "Assets" / "Scenes"
-            scenes_dir.mkdir(parents=True)
-            (scenes_dir / "AR_Battlefield.unity").write_text("")
-            (scenes_dir / "Flat_Debug.unity").write_text("")
+class TestGetBuildArgs:
+    """Tests for the arguments passed to the checked-in build script."""
 
-            # Mock Unity existence
-            with patch("pathlib.Path.exists", return_value=True):
-                unity_path = Path("/path/to/Unity")
-                issues = check_prerequisites(unity_path, project_root)
-                # May still have issues for scenes depending on target configs
+    def _arg(self, args, name):
+        return args[args.index(name) + 1]
 
+    def test_passes_scene_target_and_output(self):
+        output_path = Path("Builds") / "test.apk"
 
-class TestGenerateBuildScript:
-    """Tests for build script generation."""
+        args = get_build_args(target="quest3", profile="debug", output_path=output_path)
 
-    def test_generates_valid_csharp_script(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_root = Path(tmp_dir)
-            output_path = project_root / "Builds" / "test.apk"
+        assert self._arg(args, "-relicScene") == "Assets/Scenes/AR_Battlefield.unity"
+        assert self._arg(args, "-relicTarget") == "Android"
+        assert self._arg(args, "-relicOutput") == "Builds/test.apk"
 
-            script = generate_build_script(
-                project_root=project_root,
-                target="quest3",
-                profile="debug",
-                output_path=output_path,
-            )
+    def test_includes_development_flag_for_debug(self):
+        args = get_build_args(target="quest3", profile="debug", output_path=Path("test.apk"))
 
-            # Should contain C# class definition
-            assert "public class RelicBuildScript" in script
-            assert "public static void Build()" in script
+        assert "Development" in self._arg(args, "-relicOptions").split(",")
 
-            # Should include build options
-            assert "BuildPlayerOptions" in script
-            assert "BuildPipeline.BuildPlayer" in script
+    def test_excludes_development_flag_for_release(self):
+        args = get_build_args(target="quest3", profile="release", output_path=Path("test.apk"))
 
-    def test_includes_development_flag_for_debug(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_root = Path(tmp_dir)
-            output_path = project_root / "Builds" / "test.apk"
+        assert "Development" not in self._arg(args, "-relicOptions").split(",")
+        assert "DEVELOPMENT" not in self._arg(args, "-relicDefines").split(";")
 
-            script = generate_build_script(
-                project_root=project_root,
-                target="quest3",
-                profile="debug",
-                output_path=output_path,
-            )
+    def test_includes_defines_for_target(self):
+        args = get_build_args(target="quest3", profile="debug", output_path=Path("test.apk"))
 
-            assert "BuildOptions.Development" in script
+        defines = self._arg(args, "-relicDefines").split(";")
+        assert "QUEST_3" in defines
+        assert "XR_ENABLED" in defines
 
-    def test_excludes_development_flag_for_release(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_root = Path(tmp_dir)
-            output_path = project_root / "Builds" / "test.apk"
-
-            script = generate_build_script(
-                project_root=project_root,
-                target="quest3",
-                profile="release",
-                output_path=output_path,
-            )
-
-            # Release profile should not have Development enabled
-            # (it won't include the line that adds the flag)
-            lines = script.split("\n")
-            dev_lines = [line for line in lines if "BuildOptions.Development" in line and not line.strip().startswith("//")]
-            # The line should be commented out or empty for release
-            assert not any("options |=" in line and "Development" in line for line in lines if line.strip())
+    def test_includes_profiler_for_profile_build(self):
+        args = get_build_args(target="debug", profile="profile", output_path=Path("test.x86_64"))
 
-    def test_includes_defines_for_target(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_root = Path(tmp_dir)
-            output_path = project_root / "Builds" / "test.apk"
+        assert "EnableDeepProfilingSupport" in self._arg(args, "-relicOptions").split(",")
 
-            script = generate_build_script(
-                project_root=project_root,
-                target="quest3",
-                profile="debug",
-                output_path=output_path,
-            )
 
-            # Should include Quest 3 defines
-            assert "QUEST_3" in script
-            assert "XR_ENABLED" in script
+class TestInstallApk:
+    """Tests for APK installation via ADB."""
+
+    @pytest.fixture(autouse=True)
+    def clear_adb_cache(self):
+        _find_adb.cache_clear()
+        yield
+        _find_adb.cache_clear()
+
+    def test_fails_when_no_device(self):
+        with patch("shutil.which", return_value="/usr/bin/adb"), \
+                patch("build._spawn_wait", return_value=1) as spawn:
+            assert install_apk(Path("Relic.apk")) == 1
+            spawn.assert_called_once()
+            assert spawn.call_args[0][0] == ["/usr/bin/adb", "get-state"]
+
+    def test_installs_when_device_ready(self):
+        with patch("shutil.which", return_value="/usr/bin/adb"), \
+                patch("build._spawn_wait", return_value=0) as spawn:
+            assert install_apk(Path("Relic.apk")) == 0
+            assert spawn.call_args[0][0] == ["/usr/bin/adb", "install", "-r", "Relic.apk"]
 
-    def test_includes_profiler_for_profile_build(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            project_root = Path(tmp_dir)
-            output_path = project_root / "Builds" / "test.apk"
 
-            script = generate_build_script(
-                project_root=project_root,
-                target="debug",
-                profile="profile",
-                output_path=output_path,
-            )
+class TestSpawnWait:
+    """Tests for the helper process launcher."""
 
-            assert "EnableDeepProfilingSupport" in script
+    def test_returns_exit_code(self):
+        assert _spawn_wait([sys.executable, "-c", "raise SystemExit(3)"], quiet=True) == 3
+
+    def test_returns_none_on_timeout(self):
+        argv = [sys.executable, "-c", "import time; time.sleep(5)"]
+        assert _spawn_wait(argv, quiet=True, timeout=0.2) is None
+
+
+class TestStaging:
+    """Tests for the stable incremental build staging path."""
+
+    def test_staging_path_has_no_timestamp(self):
+        path = get_staging_path(Path("Builds"), "quest3", "release")
+        assert path == Path("Builds/Relic_quest3_release.apk")
+
+    def test_clean_removes_staged_build_and_sidecars(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = Path(tmp_dir)
+            stage_path = get_staging_path(output_dir, "quest3", "release")
+            stage_path.write_bytes(b"APK")
+            sidecar = output_dir / "Relic_quest3_release_BackUpThisFolder_ButDontShipItWithYourGame"
+            sidecar.mkdir()
+            archived = output_dir / "Relic_quest3_release_20251226_143000.apk"
+            archived.write_bytes(b"APK")
+
+            clean_staging(output_dir, "quest3", "release")
+
+            assert not stage_path.exists()
+            assert not sidecar.exists()
+            assert archived.exists()
+
+
+class TestRunUnityBuild:
+    """Tests for running Unity and archiving the staged build."""
+
+    def _fake_unity(self, output_dir, target, profile, data_folder=False):
+        """Return a subprocess.run stand-in that writes the staged build like Unity."""
+        stage_path = get_staging_path(output_dir, target, profile)
+
+        def run(cmd, **kwargs):
+            stage_path.write_bytes(b"PLAYER")
+            if data_folder:
+                data_dir = stage_path.with_name(f"{stage_path.stem}_Data")
+                data_dir.mkdir(exist_ok=True)
+                (data_dir / "globalgamemanagers").write_bytes(b"DATA")
+            return subprocess.CompletedProcess(cmd, 0)
+
+        return run
+
+    def _run(self, tmp_path, tty):
+        """Run a quest3 debug build with stdout reported as a tty or not; return run's call."""
+        fake_unity = self._fake_unity(tmp_path, "quest3", "debug")
+        with patch.object(sys.stdout, "isatty", return_value=tty), \
+                patch("subprocess.run", side_effect=fake_unity) as run:
+            project_root = tmp_path / "project"
+            assert run_unity_build(Path("Unity"), project_root, "quest3", "debug", tmp_path) == 0
+        return run.call_args
+
+    def test_interactive_build_lets_unity_write_the_log(self, tmp_path):
+        (cmd,), kwargs = self._run(tmp_path, tty=True)
+
+        assert cmd[:4] == ["Unity", "-batchmode", "-nographics", "-quit"]
+        assert cmd[cmd.index("-projectPath") + 1] == str(tmp_path / "project")
+        assert cmd[cmd.index("-logFile") + 1] == str(tmp_path / "build.log")
+        stage_path = get_staging_path(tmp_path, "quest3", "debug")
+        assert cmd[cmd.index("-relicOutput") + 1] == stage_path.as_posix()
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is subprocess.STDOUT
+
+    def test_non_interactive_build_streams_log_to_file(self, tmp_path):
+        (cmd,), kwargs = self._run(tmp_path, tty=False)
+
+        assert cmd[cmd.index("-logFile") + 1] == "-"
+        log_file = kwargs["stdout"]
+        assert log_file.name == str(tmp_path / "build.log")
+        assert log_file.mode == "wb"
+        assert log_file.closed
+        assert kwargs["stderr"] is subprocess.STDOUT
+
+    def test_archives_standalone_data_folder(self, tmp_path):
+        run = self._fake_unity(tmp_path, "debug", "debug", data_folder=True)
+        with patch("subprocess.run", side_effect=run):
+            assert run_unity_build(Path("Unity"), tmp_path, "debug", "debug", tmp_path) == 0
+
+        extension = TARGETS["debug"]["extension"]
+        [archived] = tmp_path.glob(f"Relic_debug_debug_*{extension}")
+        assert archived.read_bytes() == b"PLAYER"
+        data_dir = archived.with_name(f"{archived.stem}_Data")
+        assert (data_dir / "globalgamemanagers").read_bytes() == b"DATA"
+
+    def test_archives_apk_alone(self, tmp_path):
+        run = self._fake_unity(tmp_path, "quest3", "release")
+        with patch("subprocess.run", side_effect=run):
+            assert run_unity_build(Path("Unity"), tmp_path, "quest3", "release", tmp_path) == 0
+
+        [archived] = tmp_path.glob("Relic_quest3_release_*.apk")
+        assert archived.read_bytes() == b"PLAYER"
+        assert not list(tmp_path.glob("*_Data"))
+
+    def test_missing_staged_build_fails(self, tmp_path, capsys):
+        completed = subprocess.CompletedProcess([], 0)
+        with patch("subprocess.run", return_value=completed):
+            assert run_unity_build(Path("Unity"), tmp_path, "quest3", "debug", tmp_path) == 1
+
+        assert "did not produce" in capsys.readouterr().out
+        assert not list(tmp_path.glob("Relic_quest3_debug_*.apk"))
+
+    def test_relative_output_dir_is_resolved(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        run = self._fake_unity(Path("Builds"), "quest3", "debug")
+        with patch("subprocess.run", side_effect=run) as unity:
+            assert run_unity_build(Path("Unity"), tmp_path, "quest3", "debug", Path("Builds")) == 0
+
+        (cmd,), _ = unity.call_args
+        stage_path = get_staging_path(tmp_path / "Builds", "quest3", "debug")
+        assert cmd[cmd.index("-relicOutput") + 1] == stage_path.as_posix()
+
+
+class TestProfileBuilds:
+    """Tests for parallel multi-profile builds."""
+
+    def test_parse_profiles(self):
+        assert parse_profiles("release, profile,release") == ["release", "profile"]
+
+    def test_parse_profiles_rejects_unknown(self):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_profiles("release,fast")
+
+    def test_install_rejected_with_profiles(self, capsys):
+        argv = ["build.py", "quest3", "--profiles", "debug,release", "--install"]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exit_info:
+            main()
+
+        assert exit_info.value.code == 2
+        assert "cannot be combined with --profiles" in capsys.readouterr().err
+
+    @pytest.mark.skipif(platform.system() == "Windows", reason="Symlinks need privileges")
+    def test_prepare_profile_workdir(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_root = Path(tmp_dir) / "Relic"
+            for name in ("Assets", "Packages", "ProjectSettings", "Library"):
+                (project_root / name).mkdir(parents=True)
+            (project_root / "Library" / "ArtifactDB").write_text("cache")
+            (project_root / "ProjectSettings" / "ProjectSettings.asset").write_text("defines: []")
+
+            workdir = prepare_profile_workdir(project_root, "release")
+
+            assert workdir == Path(tmp_dir) / "Relic_release_workdir"
+            assert (workdir / "Assets").resolve() == (project_root / "Assets").resolve()
+            assert not (workdir / "Library").is_symlink()
+            assert (workdir / "Library" / "ArtifactDB").read_text() == "cache"
+
+            # The build's define changes stay in the workdir's own settings
+            settings = workdir / "ProjectSettings"
+            assert not settings.is_symlink()
+            (settings / "ProjectSettings.asset").write_text("defines: [QUEST_3]")
+            project_settings = project_root / "ProjectSettings" / "ProjectSettings.asset"
+            assert project_settings.read_text() == "defines: []"
+
+            # Reusing a workdir refreshes its settings from the project
+            assert prepare_profile_workdir(project_root, "release") == workdir
+            assert (settings / "ProjectSettings.asset").read_text() == "defines: []"
 
 
 class TestOutputNaming:
@@ -1,15 +1,13 @@
 """Tests for the config_validator tool."""
 
 import json
+import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-# Import the module under test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config_validator import (
     ConfigType,
     ValidationError,
@@ -20,91 +18,89 @@ from config_validator import (
     validate_constraints,
     validate_curve,
     validate_file,
+    validate_directory,
     load_config_file,
+    _parse_content,
+    _validate_content,
+    _get_yaml_loader,
+    main,
+    parse_jobs,
 )
 
 
-class TestConfigTypeDetection:
-    """Tests for config type detection."""
-
-    def test_detect_era_config_by_type_field(self):
-        data = {"type": "EraConfig", "name": "Ancient"}
-        assert detect_config_type(data) == ConfigType.ERA_CONFIG
-
-    def test_detect_era_config_by_heuristics(self):
-        data = {"name": "Ancient", "archetypes": []}
-        assert detect_config_type(data) == ConfigType.ERA_CONFIG
+# Serialized once at import for the file-based tests
+_VALID_UA_BYTES = json.dumps({
+    "type": "UnitArchetype",
+    "id": "spearman",
+    "base_health": 100,
+    "base_move_speed": 5.0,
+}).encode()
+_NAME_ONLY_BYTES = b'{"name": "test"}'
+_LIST_BYTES = b'["list", "not", "dict"]'
 
-    def test_detect_unit_archetype_by_type_field(self):
-        data = {"type": "UnitArchetype", "id": "spearman"}
-        assert detect_config_type(data) == ConfigType.UNIT_ARCHETYPE
 
-    def test_detect_unit_archetype_by_heuristics(self):
-        data = {"id": "spearman", "base_health": 100, "base_move_speed": 5}
-        assert detect_config_type(data) == ConfigType.UNIT_ARCHETYPE
+def error_messages(result):
+    """Join a result's error messages so a failed assert shows all of them."""
+    return " | ".join(e.message for e in result.errors)
 
-    def test_detect_weapon_stats_by_type_field(self):
-        data = {"type": "WeaponStats", "name": "sword"}
-        assert detect_config_type(data) == ConfigType.WEAPON_STATS
 
-    def test_detect_weapon_stats_by_heuristics(self):
-        data = {"name": "sword", "shots_per_burst": 1, "fire_rate": 1.0}
-        assert detect_config_type(data) == ConfigType.WEAPON_STATS
-
-    def test_detect_upgrade_definition_by_type_field(self):
-        data = {"type": "UpgradeDefinition", "name": "Veterans"}
-        assert detect_config_type(data) == ConfigType.UPGRADE_DEFINITION
-
-    def test_detect_upgrade_definition_by_heuristics(self):
-        data = {"name": "Veterans", "hit_chance_multiplier": 1.2}
-        assert detect_config_type(data) == ConfigType.UPGRADE_DEFINITION
+class TestConfigTypeDetection:
+    """Tests for config type detection."""
 
-    def test_detect_unknown_returns_none(self):
-        data = {"unknown_field": "value"}
-        assert detect_config_type(data) is None
+    @pytest.mark.parametrize("data,expected", [
+        ({"type": "EraConfig", "name": "Ancient"}, ConfigType.ERA_CONFIG),
+        ({"name": "Ancient", "archetypes": []}, ConfigType.ERA_CONFIG),
+        ({"type": "UnitArchetype", "id": "spearman"}, ConfigType.UNIT_ARCHETYPE),
+        ({"id": "spearman", "base_health": 100, "base_move_speed": 5}, ConfigType.UNIT_ARCHETYPE),
+        ({"type": "WeaponStats", "name": "sword"}, ConfigType.WEAPON_STATS),
+        ({"name": "sword", "shots_per_burst": 1, "fire_rate": 1.0}, ConfigType.WEAPON_STATS),
+        ({"type": "UpgradeDefinition", "name": "Veterans"}, ConfigType.UPGRADE_DEFINITION),
+        ({"name": "Veterans", "hit_chance_multiplier": 1.2}, ConfigType.UPGRADE_DEFINITION),
+        ({"unknown_field": "value"}, None),
+        # The type field is case-insensitive
+        ({"type": "weaponstats", "name": "rifle"}, ConfigType.WEAPON_STATS),
+        # A non-string type field falls back to heuristics
+        ({"type": 42, "base_health": 100}, ConfigType.UNIT_ARCHETYPE),
+    ])
+    def test_detect_config_type(self, data, expected):
+        assert detect_config_type(data) == expected
 
 
 class TestFieldValidation:
     """Tests for field type and constraint validation."""
 
-    def test_validate_field_type_string_success(self):
+    @pytest.mark.parametrize("value,expected_type,valid", [
+        ("hello", str, True),
+        (123, str, False),
+        (100, (int, float), True),
+        (99.5, (int, float), True),
+        ("100", (int, float), False),
+    ])
+    def test_validate_field_type(self, value, expected_type, valid):
         result = ValidationResult(file_path="test.yaml", config_type=None)
-        assert validate_field_type("hello", str, "name", result) is True
-        assert len(result.errors) == 0
+        assert validate_field_type(value, expected_type, "field", result) is valid
+        assert len(result.errors) == (0 if valid else 1)
 
-    def test_validate_field_type_string_failure(self):
+    def test_validate_field_type_failure_message(self):
         result = ValidationResult(file_path="test.yaml", config_type=None)
-        assert validate_field_type(123, str, "name", result) is False
-        assert len(result.errors) == 1
+        validate_field_type(123, str, "name", result)
         assert "Expected str" in result.errors[0].message
 
-    def test_validate_field_type_number_union_success(self):
+    @pytest.mark.parametrize("value,constraints,message", [
+        (50, {"min": 0, "max": 100}, None),
+        (-10, {"min": 0, "max": 100}, "below minimum"),
+        (150, {"min": 0, "max": 100}, "exceeds maximum"),
+        (True, {"min": 5}, "below minimum"),  # Bools are ints, so they are range-checked
+    ])
+    def test_validate_constraints(self, value, constraints, message):
         result = ValidationResult(file_path="test.yaml", config_type=None)
-        assert validate_field_type(100, (int, float), "health", result) is True
-        assert validate_field_type(99.5, (int, float), "health", result) is True
-        assert len(result.errors) == 0
-
-    def test_validate_field_type_number_union_failure(self):
-        result = ValidationResult(file_path="test.yaml", config_type=None)
-        assert validate_field_type("100", (int, float), "health", result) is False
-        assert len(result.errors) == 1
-
-    def test_validate_constraints_min_max_success(self):
-        result = ValidationResult(file_path="test.yaml", config_type=None)
-        validate_constraints(50, {"min": 0, "max": 100}, "health", result)
-        assert len(result.errors) == 0
-
-    def test_validate_constraints_below_min(self):
-        result = ValidationResult(file_path="test.yaml", config_type=None)
-        validate_constraints(-10, {"min": 0, "max": 100}, "health", result)
-        assert len(result.errors) == 1
-        assert "below minimum" in result.errors[0].message
+        validate_constraints(value, constraints, "health", result)
+        assert [message in e.message for e in result.errors] == ([True] if message else [])
 
-    def test_validate_constraints_above_max(self):
+    def test_error_path_from_prefix_and_field(self):
         result = ValidationResult(file_path="test.yaml", config_type=None)
-        validate_constraints(150, {"min": 0, "max": 100}, "health", result)
-        assert len(result.errors) == 1
-        assert "exceeds maximum" in result.errors[0].message
+        validate_field_type("fast", (int, float), ("archetypes[0]", "base_move_speed"), result)
+        assert result.errors[0].path == "archetypes[0].base_move_speed"
 
 
 class TestCurveValidation:
@@ -128,6 +124,14 @@ class TestCurveValidation:
         validate_curve(curve, "range_curve", result)
         assert len(result.errors) == 1
         assert "must be numeric" in result.errors[0].message
+        assert result.errors[0].path == "range_curve[0][1]"
+
+    def test_validate_curve_accepts_tuples_and_bools(self):
+        # Points off the exact-type fast path still get the isinstance checks
+        result = ValidationResult(file_path="test.yaml", config_type=None)
+        curve = [(0, 1.0), [1, True]]
+        validate_curve(curve, "range_curve", result)
+        assert len(result.errors) == 0
 
 
 class TestUnitArchetypeValidation:
@@ -166,7 +170,21 @@ class TestUnitArchetypeValidation:
         result = ValidationResult(file_path="test.yaml", config_type=ConfigType.UNIT_ARCHETYPE)
         validate_config(data, ConfigType.UNIT_ARCHETYPE, result)
         assert not result.is_valid
-        assert any("below minimum" in e.message for e in result.errors)
+        assert "below minimum" in error_messages(result)
+
+    def test_invalid_field_types_report_expected_types(self):
+        data = {
+            "type": "UnitArchetype",
+            "id": 7,
+            "base_health": "lots",
+            "base_move_speed": 5.0,
+        }
+        result = ValidationResult(file_path="test.yaml", config_type=ConfigType.UNIT_ARCHETYPE)
+        validate_config(data, ConfigType.UNIT_ARCHETYPE, result)
+        assert [(e.path, e.message) for e in result.errors] == [
+            ("id", "Expected str, got int"),
+            ("base_health", "Expected int or float, got str"),
+        ]
 
     def test_unknown_field_warning(self):
         data = {
@@ -182,6 +200,19 @@ class TestUnitArchetypeValidation:
         assert len(result.warnings) == 1
         assert "Unknown field" in result.warnings[0].message
 
+    def test_unknown_field_warning_suppressed(self):
+        data = {
+            "type": "UnitArchetype",
+            "id": "spearman",
+            "base_health": 100,
+            "base_move_speed": 5.0,
+            "unknown_field": "value",
+        }
+        result = ValidationResult(file_path="test.yaml", config_type=ConfigType.UNIT_ARCHETYPE)
+        validate_config(data, ConfigType.UNIT_ARCHETYPE, result, emit_warnings=False)
+        assert result.is_valid
+        assert result.warnings == []
+
 
 class TestWeaponStatsValidation:
     """Tests for WeaponStats validation."""
@@ -226,7 +257,20 @@ class TestWeaponStatsValidation:
         result = ValidationResult(file_path="test.yaml", config_type=ConfigType.WEAPON_STATS)
         validate_config(data, ConfigType.WEAPON_STATS, result)
         assert not result.is_valid
-        assert any("exceeds maximum" in e.message for e in result.errors)
+        assert "exceeds maximum" in error_messages(result)
+
+    def test_bool_in_bounded_int_field(self):
+        data = {
+            "type": "WeaponStats",
+            "name": "sword",
+            "shots_per_burst": False,  # Below minimum (1) as an int
+            "fire_rate": 1.0,
+            "base_hit_chance": 0.8,
+            "base_damage": 30,
+        }
+        result = ValidationResult(file_path="test.yaml", config_type=ConfigType.WEAPON_STATS)
+        validate_config(data, ConfigType.WEAPON_STATS, result)
+        assert [e.message for e in result.errors] == ["Value False is below minimum 1"]
 
 
 class TestUpgradeDefinitionValidation:
@@ -286,96 +330,226 @@ class TestEraConfigValidation:
         result = ValidationResult(file_path="test.yaml", config_type=ConfigType.ERA_CONFIG)
         validate_config(data, ConfigType.ERA_CONFIG, result)
         assert not result.is_valid
-        assert any("archetypes" in e.message for e in result.errors)
+        assert "archetypes" in error_messages(result)
+
+    def test_nested_entries_validated_with_paths(self):
+        data = {
+            "type": "EraConfig",
+            "name": "Ancient",
+            "archetypes": [
+                {"id": "spearman", "base_health": 100, "base_move_speed": 5},
+                {"id": "archer", "base_health": -1, "base_move_speed": 5},
+                "slinger",
+            ],
+            "upgrades": [{"damage_multiplier": 1.1}],
+        }
+        result = ValidationResult(file_path="test.yaml", config_type=ConfigType.ERA_CONFIG)
+        validate_config(data, ConfigType.ERA_CONFIG, result)
+        assert [e.path for e in result.errors] == [
+            "archetypes[2]",
+            "archetypes[1].base_health",
+            "upgrades[0].name",
+        ]
+
+    def test_shared_nested_entry_validated_once(self):
+        archetype = {"id": "spearman", "base_health": 100, "base_move_speed": 5, "bogus": 1}
+        data = {"type": "EraConfig", "name": "Ancient", "archetypes": [archetype, archetype]}
+        result = ValidationResult(file_path="test.yaml", config_type=ConfigType.ERA_CONFIG)
+        validate_config(data, ConfigType.ERA_CONFIG, result)
+        assert result.is_valid
+        assert [w.path for w in result.warnings] == ["archetypes[0].bogus"]
 
 
 class TestFileLoading:
     """Tests for config file loading."""
 
-    def test_load_json_file(self):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as tmp_file:
-            json.dump({"name": "test"}, tmp_file)
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            data, error = load_config_file(tmp_path)
-            assert error is None
-            assert data == {"name": "test"}
-        finally:
-            tmp_path.unlink()
-
-    def test_load_invalid_json(self):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as tmp_file:
-            tmp_file.write("{invalid json}")
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            data, error = load_config_file(tmp_path)
-            assert data is None
-            assert "JSON parsing error" in error
-        finally:
-            tmp_path.unlink()
-
-    def test_load_unsupported_extension(self):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as tmp_file:
-            tmp_file.write("hello")
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            data, error = load_config_file(tmp_path)
-            assert data is None
-            assert "Unsupported file extension" in error
-        finally:
-            tmp_path.unlink()
+    def test_load_json_file(self, sample_path):
+        tmp_path = sample_path(".json")
+        tmp_path.write_bytes(_NAME_ONLY_BYTES)
+
+        data, error = load_config_file(tmp_path)
+        assert error is None
+        assert data == {"name": "test"}
+
+    def test_load_invalid_json(self, sample_path):
+        tmp_path = sample_path(".json")
+        tmp_path.write_text("{invalid json}")
+
+        data, error = load_config_file(tmp_path)
+        assert data is None
+        assert "JSON parsing error" in error
+
+    def test_load_unsupported_extension(self, sample_path):
+        tmp_path = sample_path(".txt")
+        tmp_path.write_text("hello")
+
+        data, error = load_config_file(tmp_path)
+        assert data is None
+        assert "Unsupported file extension" in error
+
+    def test_load_yaml_file(self, sample_path):
+        pytest.importorskip("yaml")
+        tmp_path = sample_path(".yaml")
+        tmp_path.write_text("name: test\nrange_curve:\n  - [0, 1.0]\n")
+
+        data, error = load_config_file(tmp_path)
+        assert error is None
+        assert data == {"name": "test", "range_curve": [[0, 1.0]]}
+
+    def test_load_yaml_uses_cloader(self):
+        yaml = pytest.importorskip("yaml")
+        if not hasattr(yaml, "CSafeLoader"):
+            pytest.skip("PyYAML built without libyaml")
+        assert _get_yaml_loader() is yaml.CSafeLoader
+
+    def test_load_json_without_yaml(self, sample_path):
+        tmp_path = sample_path(".json")
+        tmp_path.write_bytes(_NAME_ONLY_BYTES)
+
+        with patch.dict(sys.modules, {"yaml": None}):
+            assert load_config_file(tmp_path) == ({"name": "test"}, None)
+
+    def test_load_json_falls_back_to_stdlib(self, sample_path):
+        good = sample_path(".json")
+        good.write_bytes(b'{"name": "stdlib"}')
+        bad = sample_path(".bad.json")
+        bad.write_bytes(b"{invalid json}")
+
+        _parse_content.cache_clear()
+        with patch.dict(sys.modules, {"orjson": None}), patch("config_validator._JSON_LOADS", None):
+            assert load_config_file(good) == ({"name": "stdlib"}, None)
+            data, error = load_config_file(bad)
+        _parse_content.cache_clear()
+
+        assert data is None
+        assert error.startswith("JSON parsing error: Expecting property name")
+
+    def test_identical_content_parsed_once(self, tmp_path):
+        content = '{"name": "cached", "base_health": 100}'
+        first = tmp_path / "first.json"
+        second = tmp_path / "second.json"
+        first.write_text(content)
+        second.write_text(content)
+
+        _parse_content.cache_clear()
+        with patch("config_validator._JSON_LOADS", wraps=json.loads) as loads:
+            assert load_config_file(first)[0] == {"name": "cached", "base_health": 100}
+            assert load_config_file(second)[0] == {"name": "cached", "base_health": 100}
+            assert loads.call_count == 1
+
+    def test_mutating_loaded_config_does_not_affect_reloads(self, tmp_path):
+        content = b'{"name": "shared", "archetypes": [{"id": "spearman"}]}'
+        first = tmp_path / "first.json"
+        second = tmp_path / "second.json"
+        first.write_bytes(content)
+        second.write_bytes(content)
+
+        data, _ = load_config_file(first)
+        data["name"] = 5
+        data["archetypes"][0]["id"] = "changed"
+
+        expected = {"name": "shared", "archetypes": [{"id": "spearman"}]}
+        assert load_config_file(second)[0] == expected
+        assert load_config_file(first)[0] == expected
 
 
 class TestFileValidation:
     """Tests for complete file validation."""
 
-    def test_validate_valid_file(self):
-        data = {
-            "type": "UnitArchetype",
-            "id": "spearman",
-            "base_health": 100,
-            "base_move_speed": 5.0,
-        }
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as tmp_file:
-            json.dump(data, tmp_file)
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            result = validate_file(tmp_path)
-            assert result.is_valid
-            assert result.config_type == ConfigType.UNIT_ARCHETYPE
-        finally:
-            tmp_path.unlink()
-
-    def test_validate_non_dict_file(self):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as tmp_file:
-            json.dump(["list", "not", "dict"], tmp_file)
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            result = validate_file(tmp_path)
-            assert not result.is_valid
-            assert any("Expected dictionary" in e.message for e in result.errors)
-        finally:
-            tmp_path.unlink()
+    def test_validate_valid_file(self, sample_path):
+        tmp_path = sample_path(".json")
+        tmp_path.write_bytes(_VALID_UA_BYTES)
+
+        result = validate_file(tmp_path)
+        assert result.is_valid
+        assert result.config_type == ConfigType.UNIT_ARCHETYPE
+
+    def test_identical_files_validated_once(self, sample_dir):
+        first = sample_dir / "first_unit.json"
+        second = sample_dir / "second_unit.json"
+        first.write_bytes(_VALID_UA_BYTES)
+        second.write_bytes(_VALID_UA_BYTES)
+
+        _validate_content.cache_clear()
+        with patch("config_validator.validate_config", wraps=validate_config) as validate:
+            results = [validate_file(first), validate_file(second)]
+            assert validate.call_count == 1
+
+        assert [r.file_path for r in results] == [str(first), str(second)]
+        assert all(r.is_valid and r.config_type == ConfigType.UNIT_ARCHETYPE for r in results)
+        results[0].add_error("field", "added later")
+        assert results[1].errors == []
+
+    def test_validate_non_dict_file(self, sample_path):
+        tmp_path = sample_path(".json")
+        tmp_path.write_bytes(_LIST_BYTES)
+
+        result = validate_file(tmp_path)
+        assert not result.is_valid
+        assert "Expected dictionary" in error_messages(result)
+
+
+class TestDirectoryValidation:
+    """Tests for validating a directory of configs."""
+
+    def test_validates_all_extensions_and_skips_tests(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "eras").mkdir()
+            (root / "tests").mkdir()
+            (root / "eras" / "ancient.yaml").write_text("name: Ancient\narchetypes: []\n")
+            (root / "eras" / "medieval.yml").write_text("name: Medieval\narchetypes: []\n")
+            (root / "sword.json").write_text('{"name": "sword", "shots_per_burst": 1}')
+            (root / "tests" / "broken.json").write_text("{broken")
+            (root / "notes.txt").write_text("not a config")
+
+            results = validate_directory(root)
+
+            names = sorted(Path(r.file_path).name for r in results)
+            assert names == ["ancient.yaml", "medieval.yml", "sword.json"]
+
+    def test_parallel_matches_serial(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            for index in range(12):
+                health = 100 if index % 3 else -1  # Every third archetype is invalid
+                (root / f"unit_{index:02}.json").write_text(json.dumps(
+                    {"id": f"unit_{index}", "base_health": health, "base_move_speed": 5}
+                ))
+
+            serial = validate_directory(root, jobs=1)
+            parallel = validate_directory(root, jobs=2)
+
+            assert [r.file_path for r in parallel] == [r.file_path for r in serial]
+            assert [r.is_valid for r in parallel] == [r.is_valid for r in serial]
+            assert sum(not r.is_valid for r in parallel) == 4
+
+    def test_validate_all_report(self, capsys):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "good.json").write_text('{"type": "UpgradeDefinition", "name": "Veterans", "bogus": 1}')
+            (root / "bad.json").write_text('{"id": "spearman", "base_health": -1, "base_move_speed": 5}')
+
+            with patch("sys.argv", ["config_validator.py", "validate-all", tmp_dir, "--jobs", "1"]):
+                assert main() == 1
+
+        lines = capsys.readouterr().out.splitlines()
+        assert f"{root / 'bad.json'}: ✗ FAILED (1 errors)" in lines
+        assert f"{root / 'good.json'}: ✓ OK (1 warnings)" in lines
+        assert "Total: 2 files, 1 errors, 1 warnings" in lines
+        assert lines[-1] == f"  - {root / 'bad.json'}"
+
+    @pytest.mark.parametrize("jobs", ["0", "-1", "many"])
+    def test_validate_all_rejects_invalid_jobs(self, tmp_path, capsys, jobs):
+        argv = ["config_validator.py", "validate-all", str(tmp_path), "--jobs", jobs]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exit_info:
+            main()
+
+        assert exit_info.value.code == 2
+        assert "must be a positive integer" in capsys.readouterr().err
+
+    def test_parse_jobs(self):
+        assert parse_jobs("3") == 3
 
 
 class TestValidationResult:
@@ -395,6 +569,10 @@ class TestValidationResult:
         result.add_warning("field", "warning message")
         assert result.is_valid  # Warnings don't affect validity
 
+    def test_result_has_no_instance_dict(self):
+        result = ValidationResult(file_path="test.yaml", config_type=ConfigType.ERA_CONFIG)
+        assert not hasattr(result, "__dict__")
+
     def test_validation_error_string(self):
         error = ValidationError("field.name", "invalid value", "error")
         assert "[ERROR] field.name: invalid value" == str(error)
@@ -1,97 +1,81 @@
 """Tests for the project_stats tool."""
 
 import json
+import os
+import sys
 import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import mock_open, patch
 
 import pytest
 
-# Import the module under test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from project_stats import (
+    EXTENSION_CATEGORIES,
     FileStats,
+    LineCounts,
     CategoryStats,
     ProjectStats,
     get_category,
     count_lines,
+    count_newlines,
     detect_era_from_path,
     collect_stats,
+    iter_project_files,
+    main,
+    print_json,
 )
 
 
 class TestGetCategory:
     """Tests for file category detection."""
 
-    def test_code_extensions(self):
-        assert get_category(Path("test.cs")) == "code"
-        assert get_category(Path("test.py")) == "code"
-        assert get_category(Path("test.sh")) == "code"
-
-    def test_config_extensions(self):
-        assert get_category(Path("test.yaml")) == "config"
-        assert get_category(Path("test.yml")) == "config"
-        assert get_category(Path("test.json")) == "config"
-        assert get_category(Path("test.asset")) == "config"
-
-    def test_scene_extension(self):
-        assert get_category(Path("test.unity")) == "scene"
-
-    def test_prefab_extension(self):
-        assert get_category(Path("test.prefab")) == "prefab"
-
-    def test_texture_extensions(self):
-        assert get_category(Path("test.png")) == "texture"
-        assert get_category(Path("test.jpg")) == "texture"
-        assert get_category(Path("test.tga")) == "texture"
-
-    def test_model_extensions(self):
-        assert get_category(Path("test.fbx")) == "model"
-        assert get_category(Path("test.obj")) == "model"
-        assert get_category(Path("test.blend")) == "model"
-
-    def test_audio_extensions(self):
-        assert get_category(Path("test.wav")) == "audio"
-        assert get_category(Path("test.mp3")) == "audio"
-        assert get_category(Path("test.ogg")) == "audio"
-
-    def test_docs_extensions(self):
-        assert get_category(Path("test.md")) == "docs"
-        assert get_category(Path("test.txt")) == "docs"
-
-    def test_unknown_extension(self):
-        assert get_category(Path("test.xyz")) == "other"
+    @pytest.mark.parametrize("suffix,category", [
+        (".cs", "code"), (".py", "code"), (".sh", "code"),
+        (".yaml", "config"), (".yml", "config"), (".json", "config"), (".asset", "config"),
+        (".unity", "scene"),
+        (".prefab", "prefab"),
+        (".png", "texture"), (".jpg", "texture"), (".tga", "texture"),
+        (".fbx", "model"), (".obj", "model"), (".blend", "model"),
+        (".wav", "audio"), (".mp3", "audio"), (".ogg", "audio"),
+        (".md", "docs"), (".txt", "docs"),
+        (".xyz", "other"),
+    ])
+    def test_category_from_extension(self, suffix, category):
+        assert get_category(Path(f"test{suffix}")) == category
+
+    def test_every_listed_extension_maps_to_its_category(self):
+        for category, extensions in EXTENSION_CATEGORIES.items():
+            for ext in extensions:
+                assert get_category(f"Assets/Models/Unit{ext.upper()}") == category
+
+    def test_categories_are_shared_string_objects(self):
+        assert get_category("a.cs") is get_category("b.py") is sys.intern("code")
+        assert get_category("a.xyz") is sys.intern("other")
 
 
 class TestCountLines:
     """Tests for line counting."""
 
-    def test_count_python_lines(self):
+    def test_count_python_lines(self, sample_path):
         content = """# Comment
 def hello():
     print("hello")
 
 # Another comment
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".py", delete=False
-        ) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            total, code, comments, blank = count_lines(tmp_path)
-            # Content has 5 non-empty lines + 1 blank line
-            assert total >= 5
-            assert blank >= 1  # At least 1 empty line
-            assert comments >= 2  # At least the # comments
-            assert code >= 2  # At least the def and print lines
-        finally:
-            tmp_path.unlink()
-
-    def test_count_csharp_lines(self):
+        tmp_path = sample_path(".py")
+        tmp_path.write_text(content)
+
+        total, code, comments, blank = count_lines(tmp_path)
+        # Content has 5 non-empty lines + 1 blank line
+        assert total >= 5
+        assert blank >= 1  # At least 1 empty line
+        assert comments >= 2  # At least the # comments
+        assert code >= 2  # At least the def and print lines
+
+    def test_count_csharp_lines(self, sample_path):
         content = """// Single line comment
 public class Test {
     /* Multi-line
@@ -99,22 +83,15 @@ public class Test {
     public void Method() { }
 }
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".cs", delete=False
-        ) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            total, code, comments, blank = count_lines(tmp_path)
-            assert total >= 6
-            assert comments >= 3  # Single + multi-line comments
-            assert code >= 2  # Class, method, closing braces
-        finally:
-            tmp_path.unlink()
-
-    def test_count_yaml_lines(self):
+        tmp_path = sample_path(".cs")
+        tmp_path.write_text(content)
+
+        total, code, comments, blank = count_lines(tmp_path)
+        assert total >= 6
+        assert comments >= 3  # Single + multi-line comments
+        assert code >= 2  # Class, method, closing braces
+
+    def test_count_yaml_lines(self, sample_path):
         content = """# YAML comment
 name: test
 value: 123
@@ -123,59 +100,124 @@ value: 123
 nested:
   key: value
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            total, code, comments, blank = count_lines(tmp_path)
-            assert total >= 7
-            assert comments >= 2
-            assert blank >= 1
-        finally:
-            tmp_path.unlink()
+        tmp_path = sample_path(".yaml")
+        tmp_path.write_text(content)
+
+        total, code, comments, blank = count_lines(tmp_path)
+        assert total >= 7
+        assert comments >= 2
+        assert blank >= 1
+
+    def test_count_csharp_block_comments_exactly(self, sample_path):
+        content = (
+            "// Header\r\n"
+            "/* Block\r\n"
+            "\r\n"
+            "   still comment */\r\n"
+            "int x; /* trailing */\r\n"
+            "   /* unclosed\r\n"
+            "int y;\r\n"
+        )
+        tmp_path = sample_path(".cs")
+        tmp_path.write_bytes(content.encode())
+
+        # Everything from the unclosed block to the end of the file is comment
+        assert count_lines(tmp_path) == (7, 1, 5, 1)
+
+    def test_count_lines_without_trailing_newline(self, sample_path):
+        tmp_path = sample_path(".py")
+        tmp_path.write_bytes(b"# Comment\n\n  \nprint('hello')")
+
+        assert count_lines(tmp_path) == (4, 1, 1, 2)
+
+    def test_count_markdown_lines_as_content(self, sample_path):
+        tmp_path = sample_path(".md")
+        tmp_path.write_bytes(b"# Title\n\nSome text\n   \n- item\n")
+
+        # Headings are content, not comments
+        assert count_lines(tmp_path) == (5, 3, 0, 2)
+
+    def test_count_lines_returns_named_counts(self, sample_path):
+        tmp_path = sample_path(".py")
+        tmp_path.write_bytes(b"# Comment\n\nx = 1\n")
+
+        counts = count_lines(tmp_path)
+        assert counts == LineCounts(total=3, code=1, comments=1, blank=1)
+        assert (counts.code, counts.comments) == (1, 1)
+
+    def test_patterns_are_not_recompiled(self, sample_path):
+        tmp_path = sample_path(".cs")
+        tmp_path.write_bytes(b"// Comment\n/* block */\nint x;\n")
+
+        with patch("project_stats.re.compile", side_effect=AssertionError("recompiled")):
+            for _ in range(3):
+                assert count_lines(tmp_path) == (3, 1, 2, 0)
+
+    @pytest.mark.parametrize("suffix,content", [
+        (".yaml", b"# top\nkey: 1\n\t\n  # indented\n\x0c\nlist:\n  - a # trailing\n"),
+        (".py", b"'''doc'''\n\ndef f():\n    \"\"\"Doc.\"\"\"\n    # note\n    return 1\r\n\r\n"),
+        (".md", b"# Heading\n\n \nText # not a comment\n"),
+    ], ids=[".yaml", ".py", ".md"])
+    def test_count_lines_matches_line_by_line_reference(self, sample_path, suffix, content):
+        tmp_path = sample_path(suffix)
+        tmp_path.write_bytes(content)
+
+        stripped = [line.strip() for line in content.splitlines()]
+        markers = {".yaml": (b"#",), ".py": (b"#", b'"""', b"'''")}.get(suffix)
+        blank = sum(not line for line in stripped)
+        comments = sum(line.startswith(markers) for line in stripped) if markers else 0
+
+        assert count_lines(tmp_path) == (len(stripped), len(stripped) - blank - comments, comments, blank)
 
     def test_count_empty_file(self):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".py", delete=False
-        ) as tmp_file:
-            tmp_file.write("")
-            tmp_file.flush()
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            total, code, comments, blank = count_lines(tmp_path)
-            assert total == 0
-            assert code == 0
-            assert comments == 0
-            assert blank == 0
-        finally:
-            tmp_path.unlink()
+        # Served from memory; no file is created
+        with patch("project_stats.open", mock_open(read_data=b""), create=True) as fake_open:
+            total, code, comments, blank = count_lines(Path("empty.py"))
 
+        fake_open.assert_called_once_with(Path("empty.py"), "rb")
+        assert total == 0
+        assert code == 0
+        assert comments == 0
+        assert blank == 0
 
-class TestDetectEraFromPath:
-    """Tests for era detection from file paths."""
 
-    def test_detect_ancient(self):
-        assert detect_era_from_path(Path("Assets/Art/Ancient/warrior.fbx")) == "Ancient"
+class TestCountNewlines:
+    """Tests for chunked newline counting of large files."""
 
-    def test_detect_medieval(self):
-        assert detect_era_from_path(Path("Assets/Art/Medieval/knight.fbx")) == "Medieval"
+    def test_counts_across_chunks(self, sample_path):
+        tmp_path = sample_path(".json")
+        tmp_path.write_bytes(b"x" * 70000 + b"\n" + b"y\n" * 10 + b"last")
 
-    def test_detect_wwii(self):
-        assert detect_era_from_path(Path("Assets/Art/WWII/soldier.fbx")) == "Wwii"
+        assert count_newlines(tmp_path) == 12
 
-    def test_detect_future(self):
-        assert detect_era_from_path(Path("Assets/Art/Future/mech.fbx")) == "Future"
+    def test_large_file_skips_classification(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            (tmp_path / "big.py").write_text("# Comment\n\n" * 10)
+            (tmp_path / "Level.asset").write_text("%YAML 1.1\nMonoBehaviour:\n")
 
-    def test_detect_case_insensitive(self):
-        assert detect_era_from_path(Path("Assets/art/ancient/warrior.fbx")) == "Ancient"
+            with patch("project_stats.MAX_COUNT_BYTES", 16):
+                stats = collect_stats(tmp_path, jobs=1)
+
+            code_file = stats.categories["code"].files[0]
+            assert (code_file.lines, code_file.code_lines, code_file.comment_lines) == (20, 20, 0)
+            assert stats.categories["config"].file_count == 1
+            assert stats.categories["config"].total_lines == 0
+
+
+class TestDetectEraFromPath:
+    """Tests for era detection from file paths."""
 
-    def test_no_era_detected(self):
-        assert detect_era_from_path(Path("Assets/Shared/texture.png")) is None
+    @pytest.mark.parametrize("path,era", [
+        ("Assets/Art/Ancient/warrior.fbx", "Ancient"),
+        ("Assets/Art/Medieval/knight.fbx", "Medieval"),
+        ("Assets/Art/WWII/soldier.fbx", "WWII"),
+        ("Assets/Art/Future/mech.fbx", "Future"),
+        ("Assets/art/ancient/warrior.fbx", "Ancient"),  # Case-insensitive
+        ("Assets/Shared/texture.png", None),
+    ])
+    def test_detect_era(self, path, era):
+        assert detect_era_from_path(Path(path)) == era
 
 
 class TestFileStats:
@@ -221,6 +263,15 @@ class TestProjectStats:
         stats.categories["texture"] = CategoryStats(category="texture", total_size_bytes=2048)
         assert stats.total_size_bytes == 3072
 
+    def test_totals_follow_category_updates(self):
+        stats = ProjectStats(root_path=Path("/test"))
+        stats.categories["code"] = CategoryStats(category="code", file_count=1, total_lines=10)
+        assert (stats.total_files, stats.total_lines) == (1, 10)
+
+        stats.categories["code"].file_count += 1
+        stats.categories["docs"] = CategoryStats(category="docs", file_count=1, total_lines=5)
+        assert (stats.total_files, stats.total_lines) == (3, 15)
+
     def test_to_dict(self):
         stats = ProjectStats(root_path=Path("/test"))
         stats.categories["code"] = CategoryStats(
@@ -237,91 +288,229 @@ class TestProjectStats:
         assert result["summary"]["total_lines"] == 1000
         assert result["categories"]["code"]["file_count"] == 10
 
+    def test_print_json_round_trips(self, capsys):
+        stats = ProjectStats(root_path=Path("/test"))
+        stats.categories["code"] = CategoryStats(category="code", file_count=2, total_lines=40)
+        stats.era_breakdown["Ancient"] = defaultdict(int, {"model": 3})
+
+        print_json(stats)
+
+        assert json.loads(capsys.readouterr().out) == stats.to_dict()
+
+    def test_stats_reject_unknown_attributes(self):
+        stats = ProjectStats(root_path=Path("/test"))
+        with pytest.raises(AttributeError):
+            stats.total_file = 3  # Typo of a property name
+        with pytest.raises(AttributeError):
+            CategoryStats(category="code").line_count = 1
+
+
+# File trees shared by the collect_stats tests, built once per module
+COLLECT_SCENARIOS = {
+    "mixed": [
+        ("test.py", "# Comment\nprint('hello')\n"),
+        ("README.md", "# Title\n\nDescription\n"),
+        ("config.json", '{"key": "value"}'),
+    ],
+    "git_ignored": [
+        (".git/config", "[core]"),
+        ("test.py", "print('hello')"),
+    ],
+    "pycache_ignored": [
+        ("__pycache__/test.cpython-310.pyc", b"\x00\x00"),
+        ("test.py", "print('hello')"),
+    ],
+    "directories": [
+        ("src/main.py", "print('main')"),
+        ("src/utils.py", "print('utils')"),
+        ("docs/README.md", "# Docs"),
+    ],
+    "ancient_art": [
+        ("Art/Ancient/warrior.fbx", b"FBX"),
+        ("Art/Ancient/texture.png", b"PNG"),
+    ],
+    "wwii_config": [
+        ("Configs/Eras/wwii.yaml", "name: WWII\n"),
+    ],
+    "code_and_docs": [
+        ("test.py", "print('hello')\n"),
+        ("README.md", "# Title\n"),
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def project_trees(tmp_path_factory):
+    """Build each COLLECT_SCENARIOS tree once and map its name to its root."""
+    base = tmp_path_factory.mktemp("proj")
+    trees = {}
+    for name, files in COLLECT_SCENARIOS.items():
+        root = base / name
+        for rel_path, content in files:
+            path = root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content.encode() if isinstance(content, str) else content)
+        trees[name] = root
+    return trees
+
 
 class TestCollectStats:
     """Tests for collecting project statistics."""
 
-    def test_collect_stats_from_temp_directory(self):
+    def test_collect_stats_from_temp_directory(self, project_trees):
+        stats = collect_stats(project_trees["mixed"])
+
+        assert stats.total_files == 3
+        assert stats.categories["code"].file_count == 1
+        assert stats.categories["docs"].file_count == 1
+        assert stats.categories["config"].file_count == 1
+
+    def test_collect_stats_ignores_git_directory(self, project_trees):
+        stats = collect_stats(project_trees["git_ignored"])
+
+        # .git files should be ignored
+        assert stats.total_files == 1
+
+    def test_collect_stats_ignores_pycache(self, project_trees):
+        stats = collect_stats(project_trees["pycache_ignored"])
+
+        # __pycache__ files should be ignored
+        assert stats.total_files == 1
+
+    def test_collect_stats_directory_breakdown(self, project_trees):
+        stats = collect_stats(project_trees["directories"])
+
+        assert "src" in stats.directory_structure
+        assert stats.directory_structure["src"] == 2
+        assert "docs" in stats.directory_structure
+        assert stats.directory_structure["docs"] == 1
+
+    def test_collect_stats_era_breakdown(self, project_trees):
+        stats = collect_stats(project_trees["ancient_art"])
+
+        assert "Ancient" in stats.era_breakdown
+        assert stats.era_breakdown["Ancient"]["model"] == 1
+        assert stats.era_breakdown["Ancient"]["texture"] == 1
+
+    def test_collect_stats_wwii_era(self, project_trees):
+        stats = collect_stats(project_trees["wwii_config"])
+
+        assert stats.era_breakdown["WWII"]["config"] == 1
+
+    def test_iter_project_files_prunes_skipped_directories(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
 
-            # Create some test files
-            (tmp_path / "test.py").write_text("# Comment\nprint('hello')\n")
-            (tmp_path / "README.md").write_text("# Title\n\nDescription\n")
-            (tmp_path / "config.json").write_text('{"key": "value"}')
+            for skipped in ("Library", "node_modules", ".vs"):
+                (tmp_path / skipped / "nested").mkdir(parents=True)
+                (tmp_path / skipped / "nested" / "file.cs").write_text("class A {}")
+            (tmp_path / ".hidden.py").write_text("print('hidden')")
+            (tmp_path / "Assets").mkdir()
+            (tmp_path / "Assets" / "unit.cs").write_text("class Unit {}")
 
-            stats = collect_stats(tmp_path)
+            unit = tmp_path / "Assets" / "unit.cs"
+            assert list(iter_project_files(tmp_path)) == [(str(unit), os.path.join("Assets", "unit.cs"), 13)]
 
-            assert stats.total_files == 3
-            assert stats.categories["code"].file_count == 1
-            assert stats.categories["docs"].file_count == 1
-            assert stats.categories["config"].file_count == 1
-
-    def test_collect_stats_ignores_git_directory(self):
+    def test_skipped_directories_are_never_opened(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
+            for skipped in ("Library", "Temp", "obj", ".git"):
+                (tmp_path / skipped / "deep").mkdir(parents=True)
+            (tmp_path / "Assets").mkdir()
+
+            opened = []
+            real_scandir = os.scandir
+
+            def recording_scandir(path):
+                opened.append(Path(path).name)
+                return real_scandir(path)
 
-            # Create .git directory with files
-            git_dir = tmp_path / ".git"
-            git_dir.mkdir()
-            (git_dir / "config").write_text("[core]")
+            with patch("project_stats.os.scandir", recording_scandir):
+                list(iter_project_files(tmp_path))
 
-            # Create a regular file
-            (tmp_path / "test.py").write_text("print('hello')")
+            assert sorted(opened) == sorted([tmp_path.name, "Assets"])
 
-            stats = collect_stats(tmp_path)
+    @pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt", reason="needs POSIX symlinks")
+    def test_symlinked_directories_are_not_followed(self, tmp_path):
+        (tmp_path / "Assets").mkdir()
+        (tmp_path / "Assets" / "unit.cs").write_text("class Unit {}")
+        (tmp_path / "Assets" / "loop").symlink_to(tmp_path, target_is_directory=True)
 
-            # .git files should be ignored
-            assert stats.total_files == 1
+        rel_paths = [rel_path for _, rel_path, _ in iter_project_files(tmp_path)]
 
-    def test_collect_stats_ignores_pycache(self):
+        assert rel_paths == [os.path.join("Assets", "unit.cs")]
+
+    def test_sizes_come_from_directory_entries(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
+            (tmp_path / "Assets").mkdir()
+            (tmp_path / "Assets" / "unit.cs").write_text("class Unit {}\n")
+            (tmp_path / "Assets" / "icon.png").write_bytes(b"PNG" * 10)
 
-            # Create __pycache__ directory with files
-            cache_dir = tmp_path / "__pycache__"
-            cache_dir.mkdir()
-            (cache_dir / "test.cpython-310.pyc").write_bytes(b"\x00\x00")
+            # No per-file stat() beyond the one cached on each DirEntry
+            with patch("project_stats.os.stat", side_effect=AssertionError("stat")), \
+                    patch("pathlib.Path.stat", side_effect=AssertionError("stat")):
+                stats = collect_stats(tmp_path, jobs=1)
 
-            # Create a regular file
-            (tmp_path / "test.py").write_text("print('hello')")
+            assert stats.total_size_bytes == 14 + 30
 
-            stats = collect_stats(tmp_path)
+    def test_collect_stats_keeps_only_requested_files(self, project_trees):
+        stats = collect_stats(project_trees["code_and_docs"], keep_files={"docs"})
 
-            # __pycache__ files should be ignored
-            assert stats.total_files == 1
+        assert stats.categories["code"].file_count == 1
+        assert stats.categories["code"].total_lines == 1
+        assert stats.categories["code"].files == []
+        assert [f.path.name for f in stats.categories["docs"].files] == ["README.md"]
+        assert stats.categories["docs"].files[0].rel_path == "README.md"
 
-    def test_collect_stats_directory_breakdown(self):
+    def test_collect_stats_parallel_matches_serial(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
 
-            # Create files in subdirectories
-            (tmp_path / "src").mkdir()
-            (tmp_path / "src" / "main.py").write_text("print('main')")
-            (tmp_path / "src" / "utils.py").write_text("print('utils')")
+            for index in range(300):
+                subdir = tmp_path / ("Ancient" if index % 2 else "Shared")
+                subdir.mkdir(exist_ok=True)
+                (subdir / f"file_{index}.py").write_text("# Comment\n" * (index % 5) + "x = 1\n")
 
-            (tmp_path / "docs").mkdir()
-            (tmp_path / "docs" / "README.md").write_text("# Docs")
+            serial = collect_stats(tmp_path, jobs=1)
+            parallel = collect_stats(tmp_path, jobs=2)
 
-            stats = collect_stats(tmp_path)
+            assert parallel.to_dict() == serial.to_dict()
+            assert parallel.categories["code"].file_count == 300
 
-            assert "src" in stats.directory_structure
-            assert stats.directory_structure["src"] == 2
-            assert "docs" in stats.directory_structure
-            assert stats.directory_structure["docs"] == 1
+    def test_collect_stats_starts_one_worker_per_chunk_at_most(self, tmp_path):
+        for index in range(300):
+            (tmp_path / f"file_{index}.py").write_text("x = 1\n")
 
-    def test_collect_stats_era_breakdown(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
+        started = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                started.append(max_workers)
+                super().__init__(max_workers)
+
+        with patch("concurrent.futures.ProcessPoolExecutor", RecordingExecutor):
+            stats = collect_stats(tmp_path, jobs=32)
+
+        assert started == [5]  # 300 files in chunks of 64
+        assert stats.categories["code"].total_lines == 300
+
+
+class TestMain:
+    """Tests for the command-line interface."""
+
+    @pytest.mark.parametrize("jobs", ["0", "-1", "many"])
+    def test_rejects_invalid_jobs(self, tmp_path, capsys, jobs):
+        argv = ["project_stats.py", "--path", str(tmp_path), "--jobs", jobs, "summary"]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exit_info:
+            main()
 
-            # Create era-specific directories
-            ancient_dir = tmp_path / "Art" / "Ancient"
-            ancient_dir.mkdir(parents=True)
-            (ancient_dir / "warrior.fbx").write_bytes(b"FBX")
-            (ancient_dir / "texture.png").write_bytes(b"PNG")
+        assert exit_info.value.code == 2
+        assert "must be a positive integer" in capsys.readouterr().err
 
-            stats = collect_stats(tmp_path)
+    def test_accepts_positive_jobs(self, tmp_path, capsys):
+        (tmp_path / "test.py").write_text("x = 1\n")
+        with patch("sys.argv", ["project_stats.py", "--path", str(tmp_path), "--jobs", "2", "--json"]):
+            assert main() == 0
 
-            assert "Ancient" in stats.era_breakdown
-            assert stats.era_breakdown["Ancient"]["model"] == 1
-            assert stats.era_breakdown["Ancient"]["texture"] == 1
+        assert json.loads(capsys.readouterr().out)["summary"]["total_files"] == 1